@@ -0,0 +1,151 @@
+import heapq
+from puzzle_state import encoding_for, is_solvable
+from ids_8puzzle import manhattan_heuristic
+
+
+def join_paths(meet, parent_f, parent_b):
+    """Start ... meet from the forward links, then meet ... goal from the backward ones"""
+    path = []
+    state = meet
+    while state is not None:
+        path.append(state)
+        state = parent_f[state]
+    path.reverse()
+    state = parent_b[meet]
+    while state is not None:
+        path.append(state)
+        state = parent_b[state]
+    return path
+
+
+def bidirectional_bfs(start, goal, stats=None):
+    """
+    Breadth-first search from both ends at once, always expanding a whole
+    layer of the smaller frontier. Once a layer produces a meeting state
+    the shortest of its meetings is returned, which is optimal.
+    """
+    if not is_solvable(start, goal):
+        return None
+    encoding = encoding_for(start)
+    start_p, goal_p = encoding.encode(start), encoding.encode(goal)
+    neighbors = encoding.neighbors
+    expanded = generated = duplicates = 0
+    peak_frontier = 2
+    meet = start_p if start_p == goal_p else None
+
+    parent_f, parent_b = {start_p: None}, {goal_p: None}
+    dist_f, dist_b = {start_p: 0}, {goal_p: 0}
+    frontier_f, frontier_b = [start_p], [goal_p]
+    while meet is None and frontier_f and frontier_b:
+        if len(frontier_f) <= len(frontier_b):
+            frontier, parent, dist, other_dist = frontier_f, parent_f, dist_f, dist_b
+        else:
+            frontier, parent, dist, other_dist = frontier_b, parent_b, dist_b, dist_f
+        best = float("inf")
+        next_frontier = []
+        for state in frontier:
+            expanded += 1
+            d = dist[state] + 1
+            for neighbor in neighbors(state):
+                generated += 1
+                if neighbor in dist:
+                    duplicates += 1
+                    continue
+                parent[neighbor] = state
+                dist[neighbor] = d
+                next_frontier.append(neighbor)
+                if neighbor in other_dist and d + other_dist[neighbor] < best:
+                    best = d + other_dist[neighbor]
+                    meet = neighbor
+        if frontier is frontier_f:
+            frontier_f = next_frontier
+        else:
+            frontier_b = next_frontier
+        if len(frontier_f) + len(frontier_b) > peak_frontier:
+            peak_frontier = len(frontier_f) + len(frontier_b)
+
+    if stats is not None:
+        stats.update(generated=generated, expanded=expanded, duplicates=duplicates,
+                     peak_frontier=peak_frontier, peak_closed=len(dist_f) + len(dist_b),
+                     pushes=generated - duplicates + 2, pops=expanded)
+        stats["states_stored"] = len(dist_f) + len(dist_b)
+    if meet is None:
+        return None
+    return [encoding.decode(s) for s in join_paths(meet, parent_f, parent_b)]
+
+
+def bidirectional_a_star(start, goal, stats=None):
+    """
+    A* from both ends with front-to-end Manhattan heuristics. It keeps the
+    best meeting cost mu and stops once mu <= max of the two smallest open
+    f-values, at which point no cheaper meeting can exist.
+    """
+    if not is_solvable(start, goal):
+        return None
+    encoding = encoding_for(start)
+    start_p, goal_p = encoding.encode(start), encoding.encode(goal)
+    neighbors = encoding.neighbors
+    h_f, h_b = manhattan_heuristic(goal), manhattan_heuristic(start)
+    expanded = generated = duplicates = pops = 0
+    pushes = peak_frontier = 2
+    counter = 0
+
+    g_f, g_b = {start_p: 0}, {goal_p: 0}
+    parent_f, parent_b = {start_p: None}, {goal_p: None}
+    open_f, open_b = [(h_f(start_p), 0, 0, start_p)], [(h_b(goal_p), 0, 0, goal_p)]
+    mu, meet = (0, start_p) if start_p == goal_p else (float("inf"), None)
+    while open_f and open_b:
+        if mu <= max(open_f[0][0], open_b[0][0]):
+            break
+        if len(open_f) <= len(open_b):
+            open_list, g, parent, h, other_g = open_f, g_f, parent_f, h_f, g_b
+        else:
+            open_list, g, parent, h, other_g = open_b, g_b, parent_b, h_b, g_f
+        f, _, g_state, state = heapq.heappop(open_list)
+        pops += 1
+        if g_state > g[state]:
+            duplicates += 1
+            continue
+        expanded += 1
+        for neighbor in neighbors(state):
+            generated += 1
+            g_new = g_state + 1
+            if g_new < g.get(neighbor, float("inf")):
+                g[neighbor] = g_new
+                parent[neighbor] = state
+                counter += 1
+                heapq.heappush(open_list, (g_new + h(neighbor), counter, g_new, neighbor))
+                pushes += 1
+                if neighbor in other_g and g_new + other_g[neighbor] < mu:
+                    mu = g_new + other_g[neighbor]
+                    meet = neighbor
+            else:
+                duplicates += 1
+        if len(open_f) + len(open_b) > peak_frontier:
+            peak_frontier = len(open_f) + len(open_b)
+
+    if stats is not None:
+        stats.update(generated=generated, expanded=expanded, duplicates=duplicates,
+                     peak_frontier=peak_frontier, peak_closed=len(g_f) + len(g_b),
+                     pushes=pushes, pops=pops)
+        stats["states_stored"] = len(g_f) + len(g_b)
+    if meet is None:
+        return None
+    return [encoding.decode(s) for s in join_paths(meet, parent_f, parent_b)]
+
+
+if __name__ == "__main__":
+    start = (8, 6, 7,
+             2, 5, 4,
+             3, 0, 1)
+    goal = (1, 2, 3,
+            4, 5, 6,
+            7, 8, 0)
+    for solver in (bidirectional_bfs, bidirectional_a_star):
+        stats = {}
+        solution = solver(start, goal, stats)
+        if solution:
+            print(f"{solver.__name__}: {len(solution) - 1} moves, "
+                  f"{stats['expanded']} nodes expanded")
+        else:
+            print(f"{solver.__name__}: no solution found.")
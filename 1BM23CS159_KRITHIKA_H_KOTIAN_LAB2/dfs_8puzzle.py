@@ -1,4 +1,8 @@
+import tracemalloc
 from collections import deque
+from puzzle_state import encoding_for
+from search_stats import PhaseClock
+
 moves = {
     "up": -3,
     "down": 3,
@@ -28,7 +32,14 @@ def get_neighbors(state):
             neighbors.append(tuple(new_state))
     return neighbors
 
-def dfs(start, goal):
+def dfs(start, goal, packed=False):
+    if packed:
+        encoding = encoding_for(start)
+        path = _dfs(encoding.encode(start), encoding.encode(goal), encoding.neighbors)
+        return None if path is None else [encoding.decode(s) for s in path]
+    return _dfs(start, goal, get_neighbors)
+
+def _dfs(start, goal, get_neighbors):
     stack = [(start, [start])] 
     visited = set()
     while stack:
@@ -44,6 +55,84 @@ def dfs(start, goal):
     return None 
 
 
+def dfs_parents(start, goal, max_depth=None, packed=True, stats=None, trace_memory=False):
+    """
+    DFS that keeps one parent link per discovered state instead of a path
+    per stack entry, and rebuilds the path only once the goal is popped.
+    With max_depth, a state reached again at a shallower depth is reopened
+    so the cap cannot hide a solution. Pass a dict as stats to get the
+    search_stats counters, phase times, the number of stored states and
+    (with trace_memory) the peak traced memory in bytes.
+    """
+    clock = PhaseClock(stats)
+    if packed:
+        encoding = encoding_for(start)
+        start, goal = encoding.encode(start), encoding.encode(goal)
+        neighbors = encoding.neighbors
+    else:
+        neighbors = get_neighbors
+    # Leave tracing that the caller already started running; only its
+    # peak is reset so it covers this search
+    own_trace = trace_memory and not tracemalloc.is_tracing()
+    if own_trace:
+        tracemalloc.start()
+    elif trace_memory:
+        tracemalloc.reset_peak()
+    clock.lap("setup")
+
+    parent = {start: (None, 0)}
+    stack = [(start, 0)]
+    peak_stack = 1
+    generated = expanded = duplicates = pops = 0
+    pushes = 1
+    path = None
+    while stack:
+        state, depth = stack.pop()
+        pops += 1
+        if depth > parent[state][1]:
+            duplicates += 1
+            continue
+        if state == goal:
+            clock.lap("search")
+            path = []
+            while state is not None:
+                path.append(state)
+                state = parent[state][0]
+            path.reverse()
+            break
+        if max_depth is not None and depth >= max_depth:
+            continue
+        expanded += 1
+        for neighbor in neighbors(state):
+            generated += 1
+            seen = parent.get(neighbor)
+            if seen is None or (max_depth is not None and depth + 1 < seen[1]):
+                parent[neighbor] = (state, depth + 1)
+                stack.append((neighbor, depth + 1))
+                pushes += 1
+            else:
+                duplicates += 1
+        if len(stack) > peak_stack:
+            peak_stack = len(stack)
+    else:
+        clock.lap("search")
+
+    if stats is not None:
+        stats.update(generated=generated, expanded=expanded, duplicates=duplicates,
+                     peak_frontier=peak_stack, peak_closed=len(parent),
+                     pushes=pushes, pops=pops)
+        stats["peak_stack"] = peak_stack
+        stats["states_stored"] = len(parent)
+        if trace_memory:
+            stats["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+    if own_trace:
+        tracemalloc.stop()
+    if path is not None and packed:
+        path = [encoding.decode(s) for s in path]
+    clock.lap("path")
+    return path
+
+
 if __name__ == "__main__":
     start = (1, 2, 3,
              4, 0, 6,
@@ -1,4 +1,8 @@
 from collections import deque
+from puzzle_state import REVERSE, encoding_for
+from puzzle_state import is_solvable as solvable
+from search_stats import PhaseClock
+
 MOVE_SET = [("up", -3), ("left", -1), ("right", 1), ("down", 3)]
 def is_valid(pos, move_name):
     if move_name == "left" and pos % 3 == 0:
@@ -22,56 +26,159 @@ def get_neighbors(state):
             neighbors.append((name, tuple(ns)))
     return neighbors
 
-def is_solvable(state):
-    arr = [x for x in state if x != 0]
-    inv = 0
-    for i in range(len(arr)):
-        for j in range(i+1, len(arr)):
-            if arr[i] > arr[j]:
-                inv += 1
-    return inv % 2 == 0
+def is_solvable(state, goal=None):
+    if goal is None:
+        goal = tuple(sorted(x for x in state if x != 0)) + (0,)
+    return solvable(state, goal)
 
-def dls(node, goal, depth, path, visited):
+def dls(node, goal, depth, path, visited, neighbors=get_neighbors):
     if node == goal:
         return path    
     if depth == 0:
         return None
-    for move, nb in get_neighbors(node):
+    for move, nb in neighbors(node):
         if nb not in visited:
             visited.add(nb)
-            result = dls(nb, goal, depth - 1, path + [(move, nb)], visited)
+            result = dls(nb, goal, depth - 1, path + [(move, nb)], visited, neighbors)
             if result is not None:
                 return result
             visited.remove(nb) 
     return None
 
-def ids(start, goal, max_depth=20):
-    if not is_solvable(start):
+def ids(start, goal, max_depth=20, packed=False):
+    if not is_solvable(start, goal):
         return None  
+    neighbors = get_neighbors
+    if packed:
+        encoding = encoding_for(start)
+        start, goal = encoding.encode(start), encoding.encode(goal)
+        neighbors = encoding.neighbors_with_moves
     for depth in range(max_depth + 1):
         visited = set([start])
-        path = dls(start, goal, depth, [("start", start)], visited)
+        path = dls(start, goal, depth, [("start", start)], visited, neighbors)
         if path is not None:
+            if packed:
+                path = [(move, encoding.decode(s)) for move, s in path]
             return path
     return None
 
 
-start = (1, 2, 3,
-         4, 0, 6,
-         7, 5, 8)
+# ----------------------------------------------------------
+# Non-recursive iterative deepening / IDA*
+# ----------------------------------------------------------
+def manhattan_heuristic(goal):
+    """Packed-state Manhattan distance to goal, via a per-position table"""
+    encoding = encoding_for(goal)
+    size = encoding.size
+    home = {tile: divmod(pos, size) for pos, tile in enumerate(goal)}
+    table = [[0 if tile == 0 else
+              abs(pos // size - home[tile][0]) + abs(pos % size - home[tile][1])
+              for tile in range(encoding.cells)] for pos in range(encoding.cells)]
+    bits, mask, cells = encoding.bits, encoding.mask, encoding.cells
+
+    def h(packed):
+        return sum(table[pos][(packed >> (pos * bits)) & mask] for pos in range(cells))
+    return h
+
+
+def iterative_deepening(start, goal, heuristic=None, max_depth=80, stats=None):
+    """
+    Iterative deepening with an explicit stack of child iterators, so the
+    depth is not bounded by Python's recursion limit. One path is grown and
+    shrunk in place and the move that undoes the previous one is never
+    tried. With a heuristic (a function of the packed state) this is IDA*:
+    each pass is bounded by f = g + h and the next bound is the smallest f
+    that was cut off. Without one it deepens one level per pass.
+    Returns [("start", start), (move, state), ...] like ids(), or None at
+    once when goal cannot be reached from start.
+    """
+    if not is_solvable(start, goal):
+        return None
+    clock = PhaseClock(stats)
+    encoding = encoding_for(start)
+    start_p, goal_p = encoding.encode(start), encoding.encode(goal)
+    neighbors = encoding.neighbors_with_moves
+    h = heuristic if heuristic is not None else (lambda packed: 0)
+    generated = expanded = duplicates = 0
+    peak_frames = 1
+    iterations = 0
+
+    def children(state, last_move):
+        undo = REVERSE.get(last_move)
+        return iter([(move, nb) for move, nb in neighbors(state) if move != undo])
+
+    bound = h(start_p)
+    path = [start_p]
+    moves = ["start"]
+    found = start_p == goal_p
+    clock.lap("setup")
+    while not found and bound <= max_depth:
+        iterations += 1
+        next_bound = float("inf")
+        frames = [children(start_p, None)]
+        expanded += 1
+        while frames:
+            step = next(frames[-1], None)
+            if step is None:
+                frames.pop()
+                if frames:
+                    path.pop()
+                    moves.pop()
+                continue
+            generated += 1
+            move, child = step
+            f = len(path) + h(child)
+            if f > bound:
+                if f < next_bound:
+                    next_bound = f
+                continue
+            path.append(child)
+            moves.append(move)
+            if child == goal_p:
+                found = True
+                break
+            expanded += 1
+            frames.append(children(child, move))
+            if len(frames) > peak_frames:
+                peak_frames = len(frames)
+        if found:
+            break
+        if heuristic is None and next_bound != float("inf"):
+            next_bound = bound + 1
+        bound = next_bound
+    clock.lap("search")
+
+    if stats is not None:
+        # No duplicate detection beyond the undo-move pruning, and no
+        # closed set: the frontier is the stack of iterator frames
+        stats.update(generated=generated, expanded=expanded, duplicates=duplicates,
+                     peak_frontier=peak_frames, peak_closed=0,
+                     pushes=expanded, pops=expanded)
+        stats["iterations"] = iterations
+        stats["bound"] = bound
+    if not found:
+        return None
+    path = [(move, encoding.decode(state)) for move, state in zip(moves, path)]
+    clock.lap("path")
+    return path
+
+if __name__ == "__main__":
+    start = (1, 2, 3,
+             4, 0, 6,
+             7, 5, 8)
 
-goal = (1, 2, 3,
-        4, 5, 6,
-        7, 8, 0)
+    goal = (1, 2, 3,
+            4, 5, 6,
+            7, 8, 0)
 
-solution = ids(start, goal, max_depth=20)
+    solution = ids(start, goal, max_depth=20)
 
-if solution:
-    for step, (move, state) in enumerate(solution):
-        print(f"Step {step}: {move}")
-        print(state[0:3])
-        print(state[3:6])
-        print(state[6:9])
-        print()
-else:
-    print("No solution found (or exceeds max_depth).")
+    if solution:
+        for step, (move, state) in enumerate(solution):
+            print(f"Step {step}: {move}")
+            print(state[0:3])
+            print(state[3:6])
+            print(state[6:9])
+            print()
+    else:
+        print("No solution found (or exceeds max_depth).")
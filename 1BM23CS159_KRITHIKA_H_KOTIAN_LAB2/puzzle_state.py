@@ -0,0 +1,119 @@
+import math
+
+# ----------------------------------------------------------
+# Packed-integer sliding-puzzle states
+# ----------------------------------------------------------
+# A state is one int: tile at position i lives in bits [i*b, (i+1)*b)
+# (b = 4 for the 8- and 15-puzzle) and the blank position is cached in
+# the bits above the board, so states hash and compare as plain ints and
+# the blank never has to be searched for.
+
+MOVE_DELTAS = [("up", -1, 0), ("left", 0, -1), ("right", 0, 1), ("down", 1, 0)]
+REVERSE = {"up": "down", "down": "up", "left": "right", "right": "left"}
+
+
+class PuzzleEncoding:
+    def __init__(self, size=3):
+        self.size = size
+        self.cells = size * size
+        self.bits = max(4, (self.cells - 1).bit_length())
+        self.mask = (1 << self.bits) - 1
+        self.blank_shift = self.bits * self.cells
+        self.board_mask = (1 << self.blank_shift) - 1
+
+        # moves[blank] = [(name, new_blank, shift of new_blank, shift of blank), ...]
+        self.moves = []
+        for pos in range(self.cells):
+            r, c = divmod(pos, size)
+            options = []
+            for name, dr, dc in MOVE_DELTAS:
+                nr, nc = r + dr, c + dc
+                if 0 <= nr < size and 0 <= nc < size:
+                    new_pos = nr * size + nc
+                    options.append((name, new_pos, new_pos * self.bits, pos * self.bits))
+            self.moves.append(options)
+
+    def encode(self, state):
+        packed = 0
+        for pos, tile in enumerate(state):
+            packed |= tile << (pos * self.bits)
+        return packed | (list(state).index(0) << self.blank_shift)
+
+    def decode(self, packed):
+        bits, mask = self.bits, self.mask
+        return tuple((packed >> (pos * bits)) & mask for pos in range(self.cells))
+
+    def blank(self, packed):
+        return packed >> self.blank_shift
+
+    def tile_at(self, packed, pos):
+        return (packed >> (pos * self.bits)) & self.mask
+
+    def apply(self, packed, new_blank, new_shift, old_shift):
+        """Slide the tile at new_blank into the blank"""
+        tile = (packed >> new_shift) & self.mask
+        blank = packed >> self.blank_shift
+        return (packed ^ (tile << new_shift) ^ (tile << old_shift)
+                ^ ((blank ^ new_blank) << self.blank_shift))
+
+    def neighbors(self, packed):
+        blank = packed >> self.blank_shift
+        apply = self.apply
+        return [apply(packed, new_blank, new_shift, old_shift)
+                for name, new_blank, new_shift, old_shift in self.moves[blank]]
+
+    def successors(self, packed):
+        """[(child, moved tile, from position, to position), ...]"""
+        blank = packed >> self.blank_shift
+        mask, apply = self.mask, self.apply
+        return [(apply(packed, new_blank, new_shift, old_shift),
+                 (packed >> new_shift) & mask, new_blank, blank)
+                for name, new_blank, new_shift, old_shift in self.moves[blank]]
+
+    def neighbors_with_moves(self, packed):
+        blank = packed >> self.blank_shift
+        apply = self.apply
+        return [(name, apply(packed, new_blank, new_shift, old_shift))
+                for name, new_blank, new_shift, old_shift in self.moves[blank]]
+
+
+EIGHT_PUZZLE = PuzzleEncoding(3)
+_encodings = {3: EIGHT_PUZZLE}
+
+
+def encoding_for(state):
+    """Shared encoding for a flat N*N state (8-puzzle, 15-puzzle, ...)"""
+    size = math.isqrt(len(state))
+    if size not in _encodings:
+        _encodings[size] = PuzzleEncoding(size)
+    return _encodings[size]
+
+
+def permutation_parity(perm):
+    """0 for an even permutation of 0..n-1, 1 for odd (by counting cycles)"""
+    seen = [False] * len(perm)
+    cycles = 0
+    for i in range(len(perm)):
+        if not seen[i]:
+            cycles += 1
+            j = i
+            while not seen[j]:
+                seen[j] = True
+                j = perm[j]
+    return (len(perm) - cycles) % 2
+
+
+def is_solvable(state, goal):
+    """
+    True if goal is reachable from state, for any N x N board and any goal.
+    Every move is a transposition with the blank, so the parity of the
+    permutation taking state to goal must match the parity of the blank's
+    Manhattan distance between the two positions.
+    """
+    size = math.isqrt(len(state))
+    where = {tile: pos for pos, tile in enumerate(goal)}
+    perm = [where[tile] for tile in state]
+    start_blank, goal_blank = list(state).index(0), list(goal).index(0)
+    blank_distance = (abs(start_blank // size - goal_blank // size)
+                      + abs(start_blank % size - goal_blank % size))
+    return permutation_parity(perm) == blank_distance % 2
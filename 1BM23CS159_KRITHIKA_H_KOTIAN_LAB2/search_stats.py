@@ -0,0 +1,30 @@
+import time
+
+# Counter names every solver uses in its stats dict:
+#   generated      children produced by expanding a node
+#   expanded       nodes whose children were generated
+#   duplicates     children dropped as already seen, plus stale frontier entries
+#   peak_frontier  largest open list / stack seen
+#   peak_closed    largest visited / closed set seen
+#   pushes, pops   frontier operations
+# Solvers count in plain local ints and copy them into the dict once at the
+# end, so passing stats=None costs nothing beyond those increments.
+COUNTERS = ("generated", "expanded", "duplicates", "peak_frontier",
+            "peak_closed", "pushes", "pops")
+
+
+class PhaseClock:
+    """Accumulates wall time per phase into stats["phases"]; a no-op without stats"""
+
+    def __init__(self, stats):
+        self.stats = stats
+        if stats is not None:
+            self.phases = stats.setdefault("phases", {})
+            self.last = time.perf_counter()
+
+    def lap(self, name):
+        if self.stats is None:
+            return
+        now = time.perf_counter()
+        self.phases[name] = self.phases.get(name, 0.0) + now - self.last
+        self.last = now
@@ -0,0 +1,216 @@
+import heapq
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "1BM23CS159_KRITHIKA_H_KOTIAN_LAB2"))
+from search_stats import PhaseClock
+
+
+def a_star_search(start, goal, neighbors, h, stats=None):
+    """
+    A* over hashable states with a g-score map and one parent link per
+    state, so heap entries are just (f, -g, counter, state) and the path is
+    rebuilt once at the end. Entries made stale by a cheaper path are
+    skipped when popped. Ties on f go to the larger g (deeper node), then
+    to insertion order, so states themselves are never compared.
+    A closed state reached again by a cheaper path is reopened, so paths
+    stay optimal with admissible but inconsistent heuristics such as the
+    pattern databases in heuristics.py (with a consistent h it never
+    happens).
+    h is either a function of the state, or an incremental heuristic with
+    __call__ for the start and update(parent_h, tile, src, dst) for each
+    child; neighbors must then yield (child, tile, src, dst) tuples.
+    With a stats dict, reports the search_stats counters and phase times.
+    """
+    clock = PhaseClock(stats)
+    update = getattr(h, "update", None)
+    g_score = {start: 0}
+    parent = {start: None}
+    closed = set()
+    counter = 0
+    open_list = [(h(start), 0, counter, start)]
+    pushes = 1
+    pops = generated = duplicates = expanded = reopened = 0
+    peak_frontier = 1
+    found = False
+
+    while open_list:
+        f, neg_g, _, state = heapq.heappop(open_list)
+        pops += 1
+        if state in closed or -neg_g > g_score[state]:
+            duplicates += 1
+            continue
+        if state == goal:
+            found = True
+            break
+        closed.add(state)
+        expanded += 1
+
+        g_new = 1 - neg_g
+        parent_h = f + neg_g
+        for item in neighbors(state):
+            generated += 1
+            if update is None:
+                neighbor = item
+            else:
+                neighbor, tile, src, dst = item
+            if g_new >= g_score.get(neighbor, g_new + 1):
+                duplicates += 1
+                continue
+            if neighbor in closed:
+                closed.discard(neighbor)
+                reopened += 1
+            g_score[neighbor] = g_new
+            parent[neighbor] = state
+            counter += 1
+            h_new = h(neighbor) if update is None else update(parent_h, tile, src, dst)
+            heapq.heappush(open_list, (g_new + h_new, -g_new, counter, neighbor))
+            pushes += 1
+        if len(open_list) > peak_frontier:
+            peak_frontier = len(open_list)
+    clock.lap("search")
+
+    if stats is not None:
+        stats.update(generated=generated, expanded=expanded, duplicates=duplicates,
+                     peak_frontier=peak_frontier, peak_closed=len(closed),
+                     pushes=pushes, pops=pops)
+        stats["reopened"] = reopened
+    if not found:
+        return None
+    path = rebuild_path(parent, goal)
+    clock.lap("path")
+    return path
+
+
+def rebuild_path(parent, goal):
+    path = []
+    state = goal
+    while state is not None:
+        path.append(state)
+        state = parent[state]
+    path.reverse()
+    return path
+
+
+def ara_star_search(start, goal, neighbors, h, time_budget=0.1,
+                    weight=3.0, weight_step=0.5, stats=None):
+    """
+    Anytime Repairing A* (Likhachev et al.). Searches with f = g + w*h,
+    starting from a large w so a first solution comes quickly, then lowers
+    w and repairs the previous search instead of starting over, keeping
+    the g-values and the open states found so far. Unlike the original
+    algorithm, a state whose g improves after it was expanded is reopened
+    straight away instead of waiting in an INCONS list for the next pass:
+    that keeps each pass's bound valid for admissible but inconsistent
+    heuristics (pattern databases), and costs nothing with consistent ones.
+    After each pass that has a solution, yields (path, bound) where bound
+    is the proven suboptimality factor (cost <= bound * optimal); stops
+    when the bound reaches 1 or time_budget seconds have passed.
+    h may be plain or incremental, as for a_star_search. A stats dict gets
+    the search_stats counters summed over all passes, the phase times,
+    and the current weight, updated before every yield.
+    """
+    clock = PhaseClock(stats)
+    deadline = time.perf_counter() + time_budget
+    update = getattr(h, "update", None)
+    g_score = {start: 0}
+    h_score = {start: h(start)}
+    parent = {start: None}
+    open_states = {start}
+    closed = set()
+    counter = 0
+    expanded = generated = duplicates = pops = reopened = 0
+    pushes = peak_frontier = peak_closed = 1
+    best_cost = None
+    proven = float("inf")
+    last = None
+    open_list = [(weight * h_score[start], 0, counter, start)]
+
+    def improve_path():
+        nonlocal counter, expanded, generated, duplicates, pops, pushes, reopened
+        nonlocal peak_frontier, peak_closed
+        while open_list:
+            key, neg_g, _, state = open_list[0]
+            goal_g = g_score.get(goal)
+            if goal_g is not None and goal_g <= key:
+                return True
+            heapq.heappop(open_list)
+            pops += 1
+            if state in closed or -neg_g != g_score[state]:
+                duplicates += 1
+                continue
+            if expanded % 256 == 0 and time.perf_counter() > deadline:
+                heapq.heappush(open_list, (key, neg_g, _, state))
+                pushes += 1
+                return False
+            open_states.discard(state)
+            closed.add(state)
+            expanded += 1
+
+            g_new = 1 - neg_g
+            parent_h = h_score[state]
+            for item in neighbors(state):
+                if update is None:
+                    neighbor = item
+                else:
+                    neighbor, tile, src, dst = item
+                generated += 1
+                if g_new >= g_score.get(neighbor, g_new + 1):
+                    duplicates += 1
+                    continue
+                g_score[neighbor] = g_new
+                parent[neighbor] = state
+                if neighbor not in h_score:
+                    h_score[neighbor] = h(neighbor) if update is None else update(parent_h, tile, src, dst)
+                if neighbor in closed:
+                    closed.discard(neighbor)
+                    reopened += 1
+                open_states.add(neighbor)
+                counter += 1
+                heapq.heappush(open_list, (g_new + weight * h_score[neighbor],
+                                           -g_new, counter, neighbor))
+                pushes += 1
+            if len(open_list) > peak_frontier:
+                peak_frontier = len(open_list)
+            if len(closed) > peak_closed:
+                peak_closed = len(closed)
+        return goal in g_score
+
+    while True:
+        finished = improve_path()
+        clock.lap("search")
+        if stats is not None:
+            stats.update(generated=generated, expanded=expanded, duplicates=duplicates,
+                         peak_frontier=peak_frontier, peak_closed=peak_closed,
+                         pushes=pushes, pops=pops)
+            stats["reopened"] = reopened
+            stats["weight"] = weight
+        if goal in g_score and (best_cost is None or g_score[goal] < best_cost):
+            best_cost = g_score[goal]
+        if finished:
+            proven = weight
+        lower = min((g_score[s] + h_score[s] for s in open_states), default=best_cost)
+        if best_cost is not None:
+            bound = max(1.0, min(proven, best_cost / lower) if lower else 1.0)
+            if last is None or (best_cost, bound) < last:
+                last = (best_cost, bound)
+                path = rebuild_path(parent, goal)
+                clock.lap("path")
+                yield path, bound
+            if bound <= 1.0:
+                return
+        if not finished or time.perf_counter() > deadline or weight <= 1.0:
+            return
+
+        weight = max(1.0, weight - weight_step)
+        closed.clear()
+        open_list = []
+        for state in open_states:
+            counter += 1
+            open_list.append((g_score[state] + weight * h_score[state],
+                              -g_score[state], counter, state))
+        heapq.heapify(open_list)
+        pushes += len(open_list)
+        clock.lap("setup")
@@ -0,0 +1,224 @@
+import argparse
+import csv
+import json
+import os
+import signal
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "1BM23CS159_KRITHIKA_H_KOTIAN_LAB2"))
+import manhattan_distance
+import misplaced
+from bidirectional_8puzzle import bidirectional_a_star, bidirectional_bfs
+from dfs_8puzzle import dfs_parents
+from ids_8puzzle import iterative_deepening
+from puzzle_state import is_solvable
+
+# Goal for instances without one, the same for every algorithm
+DEFAULT_GOAL = (1, 2, 3, 4, 5, 6, 7, 8, 0)
+
+
+# ----------------------------------------------------------
+# Algorithms: name -> solver(start, goal, stats)
+# ----------------------------------------------------------
+def run_dfs(start, goal, stats):
+    path = dfs_parents(start, goal, stats=stats)
+    stats["nodes"] = stats.get("states_stored", 0)
+    return path
+
+def run_ids(start, goal, stats):
+    path = iterative_deepening(start, goal, stats=stats)
+    stats["nodes"] = stats.get("expanded", 0)
+    return path
+
+def a_star_runner(module):
+    def run(start, goal, stats):
+        path = module.a_star(list(start), packed=True, stats=stats, goal=list(goal))
+        stats["nodes"] = stats.get("expanded", 0)
+        return path
+    return run
+
+def bidirectional_runner(search):
+    def run(start, goal, stats):
+        path = search(start, goal, stats)
+        stats["nodes"] = stats.get("expanded", 0)
+        return path
+    return run
+
+ALGORITHMS = {
+    "dfs": run_dfs,
+    "ids": run_ids,
+    "bidir-bfs": bidirectional_runner(bidirectional_bfs),
+    "bidir-astar": bidirectional_runner(bidirectional_a_star),
+    "astar-misplaced": a_star_runner(misplaced),
+    "astar-manhattan": a_star_runner(manhattan_distance),
+}
+
+
+# ----------------------------------------------------------
+# Reading instances
+# ----------------------------------------------------------
+def parse_tiles(value):
+    if isinstance(value, str):
+        value = value.replace(",", " ").split()
+    return tuple(int(x) for x in value)
+
+def read_instances(path):
+    """
+    Yield {"id", "start", "goal"} dicts from a .jsonl or .csv file.
+    JSONL lines look like {"id": "a", "start": [1, 2, ...], "goal": [...]},
+    CSV files need an id and a start column (tiles separated by spaces);
+    goal is optional in both.
+    """
+    with open(path, newline="") as f:
+        if path.endswith(".csv"):
+            rows = csv.DictReader(f)
+        else:
+            rows = (json.loads(line) for line in f if line.strip())
+        for number, row in enumerate(rows):
+            yield {
+                "id": row.get("id") or str(number),
+                "start": parse_tiles(row["start"]),
+                "goal": parse_tiles(row["goal"]) if row.get("goal") else None,
+            }
+
+
+# ----------------------------------------------------------
+# Solving in worker processes
+# ----------------------------------------------------------
+class SolveTimeout(Exception):
+    pass
+
+def _alarm(signum, frame):
+    raise SolveTimeout()
+
+def solve_instance(algorithm, instance, time_limit=None, default_goal=DEFAULT_GOAL):
+    """
+    Solve one instance in the current process; always returns a result
+    dict. Its "stats" entry holds the solver's search_stats counters.
+    Instances without a goal use default_goal, whatever the algorithm.
+    """
+    solver = ALGORITHMS[algorithm]
+    goal = instance["goal"] or tuple(default_goal)
+    result = {"id": instance["id"], "algorithm": algorithm, "solved": False,
+              "moves": None, "nodes": None, "seconds": None, "error": None}
+    stats = {}
+    begin = time.perf_counter()
+    # The alarm can go off after the solver returns but before it is
+    # disarmed, so the outer try also covers the finally block
+    try:
+        try:
+            if time_limit:
+                signal.signal(signal.SIGALRM, _alarm)
+                signal.setitimer(signal.ITIMER_REAL, time_limit)
+            if not is_solvable(instance["start"], goal):
+                result["error"] = "unsolvable"
+            else:
+                path = solver(instance["start"], goal, stats)
+                if path is not None:
+                    result["solved"] = True
+                    result["moves"] = len(path) - 1
+        finally:
+            if time_limit:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+    except SolveTimeout:
+        if not result["solved"]:
+            result["error"] = "timeout"
+    except Exception as exc:
+        result["error"] = f"{type(exc).__name__}: {exc}"
+    result["seconds"] = time.perf_counter() - begin
+    result["nodes"] = stats.get("nodes")
+    result["stats"] = stats
+    return result
+
+
+class BatchSolver:
+    """
+    Fans instances out over a process pool and yields results in input
+    order. At most max_pending instances are in flight, so arbitrarily
+    large input files are streamed. Call cancel() (e.g. from another
+    thread or a signal handler) to stop: the solver notices within
+    poll_interval seconds, drops everything still queued and terminates
+    the workers, including instances that are still running.
+    """
+
+    poll_interval = 0.1
+
+    def __init__(self, algorithm, workers=None, time_limit=None, max_pending=None,
+                 goal=DEFAULT_GOAL):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"unknown algorithm {algorithm!r}, choose from {sorted(ALGORITHMS)}")
+        self.algorithm = algorithm
+        self.workers = workers or os.cpu_count() or 1
+        self.time_limit = time_limit
+        self.goal = tuple(goal)
+        self.max_pending = max_pending or 4 * self.workers
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def _next_result(self, future):
+        """Result of future, or None once the batch is cancelled"""
+        while not self.cancelled:
+            try:
+                return future.result(timeout=self.poll_interval)
+            except TimeoutError:
+                pass
+        return None
+
+    def solve(self, instances):
+        pending = deque()
+        instances = iter(instances)
+        pool = ProcessPoolExecutor(self.workers)
+        finished = False
+        try:
+            while not self.cancelled:
+                while len(pending) < self.max_pending:
+                    instance = next(instances, None)
+                    if instance is None:
+                        break
+                    pending.append(pool.submit(solve_instance, self.algorithm,
+                                               instance, self.time_limit, self.goal))
+                if not pending:
+                    finished = True
+                    break
+                result = self._next_result(pending.popleft())
+                if result is None:
+                    break
+                yield result
+        finally:
+            if finished:
+                pool.shutdown(wait=True)
+            else:
+                # Cancelled, or the caller stopped iterating: running
+                # instances may never end on their own, so kill the workers
+                workers = list((pool._processes or {}).values())
+                pool.shutdown(wait=False, cancel_futures=True)
+                for process in workers:
+                    process.terminate()
+                for process in workers:
+                    process.join()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Solve a file of sliding-puzzle instances")
+    parser.add_argument("instances", help=".jsonl or .csv file of instances")
+    parser.add_argument("--algorithm", choices=sorted(ALGORITHMS), default="astar-manhattan")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--time-limit", type=float, default=None,
+                        help="seconds allowed per instance")
+    parser.add_argument("--goal", type=parse_tiles, default=DEFAULT_GOAL,
+                        help="goal for instances without one, e.g. '1 2 3 4 5 6 7 8 0'")
+    args = parser.parse_args()
+
+    batch = BatchSolver(args.algorithm, args.workers, args.time_limit, goal=args.goal)
+    try:
+        for result in batch.solve(read_instances(args.instances)):
+            print(json.dumps(result), flush=True)
+    except KeyboardInterrupt:
+        batch.cancel()
+        print("Cancelled.", file=sys.stderr)
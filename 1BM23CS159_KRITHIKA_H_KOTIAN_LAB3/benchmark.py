@@ -0,0 +1,152 @@
+import argparse
+import json
+import random
+import statistics
+import sys
+from collections import deque
+
+from batch_solve import ALGORITHMS, DEFAULT_GOAL, solve_instance
+from puzzle_state import encoding_for
+
+DEPTHS = (4, 8, 12, 16, 20, 24, 28)
+
+
+# ----------------------------------------------------------
+# Fixed corpus: states at known optimal depth from the goal
+# ----------------------------------------------------------
+def states_by_depth(goal, max_depth):
+    """Breadth-first search from goal; returns {depth: [packed states]}"""
+    encoding = encoding_for(goal)
+    start = encoding.encode(goal)
+    layers = {0: [start]}
+    seen = {start}
+    queue = deque([(start, 0)])
+    while queue:
+        state, d = queue.popleft()
+        if d == max_depth:
+            continue
+        for neighbor in encoding.neighbors(state):
+            if neighbor not in seen:
+                seen.add(neighbor)
+                layers.setdefault(d + 1, []).append(neighbor)
+                queue.append((neighbor, d + 1))
+    return layers
+
+
+def build_corpus(goal=DEFAULT_GOAL, depths=DEPTHS, per_depth=3, seed=0):
+    """
+    per_depth scrambles at each optimal depth. The BFS order and the seeded
+    sample are deterministic, so the same arguments always give the same
+    corpus and results from different runs can be compared.
+    """
+    encoding = encoding_for(goal)
+    layers = states_by_depth(goal, max(depths))
+    rng = random.Random(seed)
+    corpus = []
+    for depth in depths:
+        layer = layers.get(depth, [])
+        for i, state in enumerate(rng.sample(layer, min(per_depth, len(layer)))):
+            corpus.append({"id": f"d{depth}-{i}", "depth": depth,
+                           "start": encoding.decode(state), "goal": tuple(goal)})
+    return corpus
+
+
+# ----------------------------------------------------------
+# Running and summarising
+# ----------------------------------------------------------
+def run_benchmark(corpus, algorithms=None, time_limit=10.0):
+    """Solve every instance with every algorithm in this process"""
+    results = []
+    for algorithm in algorithms or sorted(ALGORITHMS):
+        for instance in corpus:
+            result = solve_instance(algorithm, instance, time_limit)
+            result["depth"] = instance["depth"]
+            results.append(result)
+            print(f"{algorithm:16} {instance['id']:8} "
+                  f"{'ok' if result['solved'] else result['error']:8} "
+                  f"{result['seconds']:.3f}s", file=sys.stderr)
+    return results
+
+
+def summarize(results):
+    """{algorithm: {depth: totals}} with node counts and median wall time"""
+    groups = {}
+    for result in results:
+        groups.setdefault(result["algorithm"], {}).setdefault(str(result["depth"]), []).append(result)
+    summary = {}
+    for algorithm, by_depth in groups.items():
+        summary[algorithm] = {}
+        for depth, group in by_depth.items():
+            solved = [r for r in group if r["solved"]]
+            summary[algorithm][depth] = {
+                "instances": len(group),
+                "solved": len(solved),
+                "moves": sum(r["moves"] for r in solved),
+                "expanded": sum(r["stats"].get("expanded", 0) for r in group),
+                "generated": sum(r["stats"].get("generated", 0) for r in group),
+                "peak_frontier": max(r["stats"].get("peak_frontier", 0) for r in group),
+                "peak_closed": max(r["stats"].get("peak_closed", 0) for r in group),
+                "median_seconds": statistics.median(r["seconds"] for r in group),
+            }
+    return summary
+
+
+def compare(summary, baseline, time_tolerance=0.5, min_seconds=0.01):
+    """
+    List regressions of summary against a baseline summary: fewer solved
+    instances, longer solutions, more expanded nodes, or a median time
+    more than time_tolerance slower (ignored below min_seconds, where the
+    timer noise dominates).
+    """
+    regressions = []
+    for algorithm, by_depth in summary.items():
+        for depth, now in by_depth.items():
+            old = baseline.get(algorithm, {}).get(depth)
+            if old is None:
+                continue
+            where = f"{algorithm} depth {depth}"
+            if now["solved"] < old["solved"]:
+                regressions.append(f"{where}: solved {old['solved']} -> {now['solved']}")
+            elif now["solved"] == old["solved"] and now["moves"] > old["moves"]:
+                regressions.append(f"{where}: moves {old['moves']} -> {now['moves']}")
+            if now["expanded"] > old["expanded"]:
+                regressions.append(f"{where}: expanded {old['expanded']} -> {now['expanded']}")
+            slow, fast = now["median_seconds"], old["median_seconds"]
+            if slow > min_seconds and slow > fast * (1 + time_tolerance):
+                regressions.append(f"{where}: median time {fast:.3f}s -> {slow:.3f}s")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark every puzzle solver on a fixed corpus")
+    parser.add_argument("--output", default="benchmark.json")
+    parser.add_argument("--baseline", default=None, help="earlier --output file to compare against")
+    parser.add_argument("--algorithms", default=None, help="comma separated, default all")
+    parser.add_argument("--depths", default=",".join(map(str, DEPTHS)))
+    parser.add_argument("--per-depth", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--time-limit", type=float, default=10.0, help="seconds per instance")
+    parser.add_argument("--time-tolerance", type=float, default=0.5)
+    args = parser.parse_args()
+
+    depths = tuple(int(d) for d in args.depths.split(","))
+    algorithms = args.algorithms.split(",") if args.algorithms else None
+    corpus = build_corpus(depths=depths, per_depth=args.per_depth, seed=args.seed)
+    results = run_benchmark(corpus, algorithms, args.time_limit)
+    summary = summarize(results)
+    with open(args.output, "w") as f:
+        json.dump({"depths": depths, "per_depth": args.per_depth, "seed": args.seed,
+                   "summary": summary, "results": results}, f, indent=1)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if (baseline["depths"], baseline["per_depth"], baseline["seed"]) != (list(depths), args.per_depth, args.seed):
+            sys.exit("Baseline was run on a different corpus")
+        regressions = compare(summary, baseline["summary"], args.time_tolerance)
+        for line in regressions:
+            print("REGRESSION", line)
+        if regressions:
+            sys.exit(1)
+        print("No regressions against", args.baseline)
@@ -0,0 +1,107 @@
+import math
+import mmap
+import os
+import sys
+from collections import deque
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "1BM23CS159_KRITHIKA_H_KOTIAN_LAB2"))
+from puzzle_state import encoding_for
+
+DB_MAGIC = b"PDB\x01"
+UNREACHABLE = 0xFF
+FACTORIALS = [math.factorial(i) for i in range(26)]
+
+
+def lehmer_rank(state):
+    """Rank of a permutation of 0..n-1 in lexicographic order (0 .. n!-1)"""
+    n = len(state)
+    rank = 0
+    for i in range(n):
+        smaller = 0
+        for j in range(i + 1, n):
+            if state[j] < state[i]:
+                smaller += 1
+        rank += smaller * FACTORIALS[n - 1 - i]
+    return rank
+
+
+def build_distance_db(goal, path):
+    """
+    Retrograde BFS from goal over every reachable state, writing each
+    state's exact distance to goal as one byte at its Lehmer rank
+    (0xFF for the half of the permutations that cannot reach goal).
+    Returns the number of reachable states (181440 for the 8-puzzle).
+    """
+    goal = tuple(goal)
+    encoding = encoding_for(goal)
+    distances = bytearray([UNREACHABLE]) * math.factorial(len(goal))
+    start = encoding.encode(goal)
+    distances[lehmer_rank(goal)] = 0
+    queue = deque([(start, 0)])
+    count = 1
+    while queue:
+        state, d = queue.popleft()
+        for neighbor in encoding.neighbors(state):
+            rank = lehmer_rank(encoding.decode(neighbor))
+            if distances[rank] == UNREACHABLE:
+                distances[rank] = d + 1
+                queue.append((neighbor, d + 1))
+                count += 1
+    with open(path, "wb") as f:
+        f.write(DB_MAGIC + bytes([len(goal)]) + bytes(goal))
+        f.write(distances)
+    return count
+
+
+class DistanceDB:
+    """Memory-mapped distance table written by build_distance_db"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.data[:4] != DB_MAGIC:
+            raise ValueError(f"{path} is not a puzzle distance database")
+        n = self.data[4]
+        self.goal = tuple(self.data[5:5 + n])
+        self.offset = 5 + n
+        self.encoding = encoding_for(self.goal)
+
+    def distance(self, state):
+        """Exact number of moves from state to goal, or None if unreachable"""
+        d = self.data[self.offset + lehmer_rank(state)]
+        return None if d == UNREACHABLE else d
+
+    def solve(self, start):
+        """Optimal path by greedy descent: always step to a neighbor one move closer"""
+        d = self.distance(start)
+        if d is None:
+            return None
+        state = tuple(start)
+        path = [state]
+        while d > 0:
+            for neighbor in self.encoding.neighbors(self.encoding.encode(state)):
+                neighbor = self.encoding.decode(neighbor)
+                if self.distance(neighbor) == d - 1:
+                    break
+            state, d = neighbor, d - 1
+            path.append(state)
+        return path
+
+    def close(self):
+        self.data.close()
+
+
+if __name__ == "__main__":
+    goal_state = (1, 2, 3, 8, 0, 4, 7, 6, 5)
+    db_path = sys.argv[1] if len(sys.argv) > 1 else "8puzzle.pdb"
+    if not os.path.exists(db_path):
+        count = build_distance_db(goal_state, db_path)
+        print(f"Wrote distances for {count} states to {db_path}")
+    db = DistanceDB(db_path)
+    path = db.solve((2, 8, 3, 1, 6, 4, 7, 0, 5))
+    print(f"Optimal solution in {len(path) - 1} moves:")
+    for step in path:
+        for i in range(0, 9, 3):
+            print(list(step[i:i + 3]))
+        print()
@@ -0,0 +1,230 @@
+import argparse
+import bisect
+import mmap
+import struct
+from collections import deque
+
+from manhattan_distance import ManhattanHeuristic
+from puzzle_state import encoding_for
+
+# Suggested disjoint tile partitions for the standard goals. Building a
+# pattern of k tiles on c cells visits c!/(c-k)! * c (pattern, blank)
+# states, so 5x5 uses 5-tile groups: each is about 6.4M entries and a
+# 160 MB visited table, while a 6-tile group would need over 3 GB.
+PARTITIONS = {
+    3: [(1, 2, 3, 4), (5, 6, 7, 8)],
+    4: [(1, 5, 6, 9, 10, 13), (7, 8, 11, 12, 14, 15), (2, 3, 4)],
+    5: [(1, 2, 3, 6, 7), (4, 5, 8, 9, 10), (11, 12, 16, 17, 21),
+        (13, 14, 15, 18, 19), (20, 22, 23, 24)],
+}
+
+
+# ----------------------------------------------------------
+# Manhattan distance + linear conflict
+# ----------------------------------------------------------
+def line_conflicts(goal_slots):
+    """
+    Minimum number of tiles to take out of one row/column so that the
+    rest are in goal order; each such tile costs two extra moves.
+    goal_slots lists, in board order, the goal column (or row) of each
+    tile in the line whose goal is on this line. The tiles that may stay
+    are a longest increasing subsequence, so the answer is the rest.
+    """
+    tails = []
+    for slot in goal_slots:
+        i = bisect.bisect_left(tails, slot)
+        if i == len(tails):
+            tails.append(slot)
+        else:
+            tails[i] = slot
+    return len(goal_slots) - len(tails)
+
+
+class LinearConflictHeuristic:
+    """Manhattan distance plus 2 per tile that must leave its row or column"""
+
+    def __init__(self, goal):
+        self.manhattan = ManhattanHeuristic(goal)
+        self.encoding = encoding_for(goal)
+        size = self.encoding.size
+        self.home = {tile: divmod(pos, size) for pos, tile in enumerate(goal)}
+
+    def __call__(self, packed):
+        encoding, home = self.encoding, self.home
+        size = encoding.size
+        board = encoding.decode(packed)
+        extra = 0
+        for line in range(size):
+            row_slots, col_slots = [], []
+            for k in range(size):
+                tile = board[line * size + k]
+                if tile and home[tile][0] == line:
+                    row_slots.append(home[tile][1])
+                tile = board[k * size + line]
+                if tile and home[tile][1] == line:
+                    col_slots.append(home[tile][0])
+            if len(row_slots) > 1:
+                extra += line_conflicts(row_slots)
+            if len(col_slots) > 1:
+                extra += line_conflicts(col_slots)
+        return self.manhattan(packed) + 2 * extra
+
+
+# ----------------------------------------------------------
+# Additive disjoint pattern databases
+# ----------------------------------------------------------
+PDB_MAGIC = b"APDB"
+PDB_HEADER = struct.Struct("<4sBB")
+
+
+def pattern_rank(positions, cells):
+    """Rank of distinct positions among the cells!/(cells-k)! placements"""
+    rank = 0
+    used = 0
+    for i, p in enumerate(positions):
+        # p minus the number of earlier positions below it
+        rank = rank * (cells - i) + p - (used & ((1 << p) - 1)).bit_count()
+        used |= 1 << p
+    return rank
+
+
+def pattern_size(k, cells):
+    total = 1
+    for i in range(k):
+        total *= cells - i
+    return total
+
+
+def build_pattern(goal, tiles):
+    """
+    0-1 BFS over (pattern tile positions, blank position) from the goal.
+    Only moves of pattern tiles cost 1, so the stored distances of
+    disjoint patterns can be added. Returns one byte per placement.
+    """
+    encoding = encoding_for(goal)
+    cells = encoding.cells
+    adjacent = [[nb for _, nb, _, _ in encoding.moves[pos]] for pos in range(cells)]
+    entries = pattern_size(len(tiles), cells)
+    table = bytearray(b"\xff") * entries
+    seen = bytearray(entries * cells)
+
+    start = tuple(list(goal).index(t) for t in tiles)
+    queue = deque([(0, start, list(goal).index(0))])
+    while queue:
+        d, positions, blank = queue.popleft()
+        rank = pattern_rank(positions, cells)
+        if seen[rank * cells + blank]:
+            continue
+        seen[rank * cells + blank] = 1
+        if d < table[rank]:
+            table[rank] = d
+        for nb in adjacent[blank]:
+            if nb in positions:
+                moved = tuple(blank if p == nb else p for p in positions)
+                if not seen[pattern_rank(moved, cells) * cells + nb]:
+                    queue.append((d + 1, moved, nb))
+            elif not seen[rank * cells + nb]:
+                queue.appendleft((d, positions, nb))
+    return table
+
+
+def build_pattern_database(goal, partition, path):
+    """Build every pattern of a disjoint partition and write them to one file"""
+    size = encoding_for(goal).size
+    with open(path, "wb") as f:
+        f.write(PDB_HEADER.pack(PDB_MAGIC, size, len(partition)))
+        f.write(bytes(goal))
+        for tiles in partition:
+            f.write(bytes([len(tiles)]) + bytes(tiles))
+        for tiles in partition:
+            f.write(build_pattern(goal, tiles))
+
+
+class PatternDatabaseHeuristic:
+    """
+    Sum of the pattern distances of a disjoint pattern database. The file
+    is memory-mapped on first use, so solver startup stays cheap and only
+    the pages that are actually probed get read.
+    """
+
+    def __init__(self, path, goal=None):
+        self.path = path
+        self.expected_goal = None if goal is None else tuple(goal)
+        self.data = None
+
+    def load(self):
+        with open(self.path, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, size, count = PDB_HEADER.unpack_from(self.data, 0)
+        if magic != PDB_MAGIC:
+            raise ValueError(f"{self.path} is not a pattern database")
+        offset = PDB_HEADER.size
+        self.goal = tuple(self.data[offset:offset + size * size])
+        if self.expected_goal is not None:
+            self.check_goal(self.expected_goal)
+        self.encoding = encoding_for(self.goal)
+        offset += size * size
+        self.patterns = []
+        for _ in range(count):
+            k = self.data[offset]
+            self.patterns.append(tuple(self.data[offset + 1:offset + 1 + k]))
+            offset += 1 + k
+        self.offsets = []
+        for tiles in self.patterns:
+            self.offsets.append(offset)
+            offset += pattern_size(len(tiles), size * size)
+
+    def check_goal(self, goal):
+        """Raise ValueError unless the database was built for goal"""
+        if self.data is None:
+            self.load()
+        if tuple(goal) != self.goal:
+            raise ValueError(f"{self.path} was built for goal {self.goal}, not {tuple(goal)}")
+
+    def __call__(self, packed):
+        if self.data is None:
+            self.load()
+        encoding = self.encoding
+        cells, bits, mask = encoding.cells, encoding.bits, encoding.mask
+        where = [0] * cells
+        for pos in range(cells):
+            where[(packed >> (pos * bits)) & mask] = pos
+        data = self.data
+        return sum(data[offset + pattern_rank([where[t] for t in tiles], cells)]
+                   for tiles, offset in zip(self.patterns, self.offsets))
+
+
+class MaxHeuristic:
+    """Pointwise maximum of admissible heuristics (still admissible)"""
+
+    def __init__(self, *heuristics):
+        self.heuristics = heuristics
+
+    def check_goal(self, goal):
+        for h in self.heuristics:
+            check = getattr(h, "check_goal", None)
+            if check is not None:
+                check(goal)
+
+    def __call__(self, packed):
+        return max(h(packed) for h in self.heuristics)
+
+
+def standard_goal(size):
+    return tuple(range(1, size * size)) + (0,)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build an additive pattern database")
+    parser.add_argument("size", type=int, help="board width (3, 4 or 5)")
+    parser.add_argument("output")
+    parser.add_argument("--partition", default=None,
+                        help="tile groups, e.g. '1,5,6,9,10,13/7,8,11,12,14,15/2,3,4'")
+    args = parser.parse_args()
+    if args.partition:
+        partition = [tuple(int(t) for t in group.split(","))
+                     for group in args.partition.split("/")]
+    else:
+        partition = PARTITIONS[args.size]
+    build_pattern_database(standard_goal(args.size), partition, args.output)
+    print(f"Wrote {len(partition)} patterns to {args.output}")
@@ -1,62 +1,124 @@
-import heapq
+import math
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "1BM23CS159_KRITHIKA_H_KOTIAN_LAB2"))
+from puzzle_state import encoding_for
+from astar_core import a_star_search, ara_star_search
 
 goal_state = [1,2,3,8,0,4,7,6,5]
 
-goal_positions = {val: (i // 3, i % 3) for i, val in enumerate(goal_state)}
+def board_size(state):
+    return math.isqrt(len(state))
+
+def goal_positions_for(goal):
+    size = board_size(goal)
+    return {val: divmod(i, size) for i, val in enumerate(goal)}
+
+goal_positions = goal_positions_for(goal_state)
 
-def h_manhattan(state):
+def h_manhattan(state, goal=None):
     """Manhattan distance heuristic"""
+    positions = goal_positions if goal is None else goal_positions_for(goal)
+    size = board_size(state)
     distance = 0
     for i, val in enumerate(state):
         if val != 0:
-            r, c = divmod(i, 3)
-            gr, gc = goal_positions[val]
+            r, c = divmod(i, size)
+            gr, gc = positions[val]
             distance += abs(r - gr) + abs(c - gc)
     return distance
 
+class ManhattanHeuristic:
+    """
+    Manhattan distance on packed N x N states. A move shifts exactly one
+    tile, so update() derives the child's value from the parent's in O(1)
+    using the precomputed table[pos][tile] distances.
+    """
+
+    def __init__(self, goal):
+        self.encoding = encoding_for(goal)
+        cells, size = self.encoding.cells, self.encoding.size
+        home = goal_positions_for(goal)
+        self.table = [[0 if val == 0 else
+                       abs(pos // size - home[val][0]) + abs(pos % size - home[val][1])
+                       for val in range(cells)] for pos in range(cells)]
+
+    def __call__(self, packed):
+        table, bits, mask = self.table, self.encoding.bits, self.encoding.mask
+        return sum(table[pos][(packed >> (pos * bits)) & mask]
+                   for pos in range(self.encoding.cells))
+
+    def update(self, h, tile, src, dst):
+        return h - self.table[src][tile] + self.table[dst][tile]
+
+h_manhattan_packed = ManhattanHeuristic(goal_state)
+
 def get_neighbors(state):
     """Generate neighbor states (1D array)"""
     neighbors = []
+    size = board_size(state)
     zero_index = state.index(0)
-    row, col = divmod(zero_index, 3)
+    row, col = divmod(zero_index, size)
     moves = [(-1,0),(1,0),(0,-1),(0,1)]
 
     for dr, dc in moves:
         r, c = row + dr, col + dc
-        if 0 <= r < 3 and 0 <= c < 3:
-            new_index = r*3 + c
+        if 0 <= r < size and 0 <= c < size:
+            new_index = r*size + c
             new_state = state[:]
             new_state[zero_index], new_state[new_index] = new_state[new_index], new_state[zero_index]
             neighbors.append(new_state)
     return neighbors
 
-def a_star(start_state):
-    open_list = []
-    visited = set()
-
-    h = h_manhattan(start_state)
-    heapq.heappush(open_list, (h, 0, start_state, [start_state]))
-
-    while open_list:
-        f, g, state, path = heapq.heappop(open_list)
-
-        if state == goal_state:
-            return path
-
-        state_key = tuple(state)
-        if state_key in visited:
-            continue
-        visited.add(state_key)
+def a_star(start_state, packed=False, stats=None, goal=None, heuristic=None):
+    """
+    A* with the Manhattan heuristic towards goal (goal_state by default).
+    With packed=True any heuristic on packed states can be plugged in,
+    e.g. the linear-conflict or pattern-database ones in heuristics.py.
+    """
+    if packed or heuristic is not None:
+        return a_star_packed(start_state, stats, goal, heuristic)
+    goal = goal_state if goal is None else goal
+    h = h_manhattan if goal is goal_state else (lambda s: h_manhattan(s, goal))
+    path = a_star_search(tuple(start_state), tuple(goal),
+                         lambda s: [tuple(n) for n in get_neighbors(list(s))],
+                         h, stats)
+    return None if path is None else [list(s) for s in path]
 
-        for neighbor in get_neighbors(state):
-            if tuple(neighbor) in visited:
-                continue
-            g_new = g + 1
-            h_new = h_manhattan(neighbor)
-            f_new = g_new + h_new
-            heapq.heappush(open_list, (f_new, g_new, neighbor, path + [neighbor]))
+def a_star_packed(start_state, stats=None, goal=None, heuristic=None):
+    """Same search as a_star, but states are packed ints (see puzzle_state)"""
+    goal = goal_state if goal is None else goal
+    encoding = encoding_for(start_state)
+    if heuristic is None:
+        heuristic = h_manhattan_packed if goal is goal_state else ManhattanHeuristic(goal)
+    check_goal = getattr(heuristic, "check_goal", None)
+    if check_goal is not None:
+        check_goal(goal)
+    neighbors = encoding.successors if hasattr(heuristic, "update") else encoding.neighbors
+    path = a_star_search(encoding.encode(start_state), encoding.encode(goal),
+                         neighbors, heuristic, stats)
+    return None if path is None else [list(encoding.decode(s)) for s in path]
 
-    return None
+def a_star_anytime(start_state, time_budget=0.1, goal=None, heuristic=None,
+                   weight=3.0, stats=None):
+    """
+    Anytime mode (ARA*): yields (path, bound) pairs, each path at most
+    bound times longer than optimal, tightening until time_budget seconds
+    are used up or the path is proven optimal.
+    """
+    goal = goal_state if goal is None else goal
+    encoding = encoding_for(start_state)
+    if heuristic is None:
+        heuristic = h_manhattan_packed if goal is goal_state else ManhattanHeuristic(goal)
+    check_goal = getattr(heuristic, "check_goal", None)
+    if check_goal is not None:
+        check_goal(goal)
+    neighbors = encoding.successors if hasattr(heuristic, "update") else encoding.neighbors
+    for path, bound in ara_star_search(encoding.encode(start_state), encoding.encode(goal),
+                                       neighbors, heuristic, time_budget, weight, stats=stats):
+        yield [list(encoding.decode(s)) for s in path], bound
 
 if __name__ == "__main__":
     start_state = [2,8,3,1,6,4,7,0,5]
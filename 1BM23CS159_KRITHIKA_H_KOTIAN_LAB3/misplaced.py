@@ -1,52 +1,85 @@
-import heapq
+import math
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "1BM23CS159_KRITHIKA_H_KOTIAN_LAB2"))
+from puzzle_state import encoding_for
+from astar_core import a_star_search, ara_star_search
 
 goal_state = [1,2,3,8,0,4,7,6,5]
 
-def h_misplaced(state):
-    return sum(1 for i in range(9) if state[i] != 0 and state[i] != goal_state[i])
+def h_misplaced(state, goal=None):
+    goal = goal_state if goal is None else goal
+    return sum(1 for i in range(len(state)) if state[i] != 0 and state[i] != goal[i])
+
+class MisplacedHeuristic:
+    """Misplaced-tile count on packed N x N states, with O(1) per-move updates"""
+
+    def __init__(self, goal):
+        self.encoding = encoding_for(goal)
+        cells = self.encoding.cells
+        # table[pos][tile]: 1 if tile at pos is out of place
+        self.table = [[int(val != 0 and val != goal[pos]) for val in range(cells)]
+                      for pos in range(cells)]
+
+    def __call__(self, packed):
+        table, bits, mask = self.table, self.encoding.bits, self.encoding.mask
+        return sum(table[pos][(packed >> (pos * bits)) & mask]
+                   for pos in range(self.encoding.cells))
+
+    def update(self, h, tile, src, dst):
+        return h - self.table[src][tile] + self.table[dst][tile]
+
+h_misplaced_packed = MisplacedHeuristic(goal_state)
 
 def get_neighbors(state):
     neighbors = []
+    size = math.isqrt(len(state))
     zero_index = state.index(0)
-    row, col = divmod(zero_index, 3)
+    row, col = divmod(zero_index, size)
     moves = [(-1,0),(1,0),(0,-1),(0,1)]  
 
     for dr, dc in moves:
         r, c = row + dr, col + dc
-        if 0 <= r < 3 and 0 <= c < 3:
-            new_index = r*3 + c
+        if 0 <= r < size and 0 <= c < size:
+            new_index = r*size + c
             new_state = state[:]
             new_state[zero_index], new_state[new_index] = new_state[new_index], new_state[zero_index]
             neighbors.append(new_state)
     return neighbors
 
-def a_star(start_state):
-    open_list = []
-    visited = set()
-
-    h = h_misplaced(start_state)
-    heapq.heappush(open_list, (h, 0, start_state, [start_state]))
-
-    while open_list:
-        f, g, state, path = heapq.heappop(open_list)
-
-        if state == goal_state:
-            return path
-
-        state_key = tuple(state)
-        if state_key in visited:
-            continue
-        visited.add(state_key)
+def a_star(start_state, packed=False, stats=None, goal=None):
+    if packed:
+        return a_star_packed(start_state, stats, goal)
+    goal = goal_state if goal is None else goal
+    path = a_star_search(tuple(start_state), tuple(goal),
+                         lambda s: [tuple(n) for n in get_neighbors(list(s))],
+                         lambda s: h_misplaced(s, goal), stats)
+    return None if path is None else [list(s) for s in path]
 
-        for neighbor in get_neighbors(state):
-            if tuple(neighbor) in visited:
-                continue
-            g_new = g + 1
-            h_new = h_misplaced(neighbor)
-            f_new = g_new + h_new
-            heapq.heappush(open_list, (f_new, g_new, neighbor, path + [neighbor]))
+def a_star_packed(start_state, stats=None, goal=None):
+    """Same search as a_star, but states are packed ints (see puzzle_state)"""
+    goal = goal_state if goal is None else goal
+    encoding = encoding_for(start_state)
+    heuristic = h_misplaced_packed if goal is goal_state else MisplacedHeuristic(goal)
+    path = a_star_search(encoding.encode(start_state), encoding.encode(goal),
+                         encoding.successors, heuristic, stats)
+    return None if path is None else [list(encoding.decode(s)) for s in path]
 
-    return None
+def a_star_anytime(start_state, time_budget=0.1, goal=None, weight=3.0, stats=None):
+    """
+    Anytime mode (ARA*): yields (path, bound) pairs, each path at most
+    bound times longer than optimal, tightening until time_budget seconds
+    are used up or the path is proven optimal.
+    """
+    goal = goal_state if goal is None else goal
+    encoding = encoding_for(start_state)
+    heuristic = h_misplaced_packed if goal is goal_state else MisplacedHeuristic(goal)
+    neighbors = encoding.successors
+    for path, bound in ara_star_search(encoding.encode(start_state), encoding.encode(goal),
+                                       neighbors, heuristic, time_budget, weight, stats=stats):
+        yield [list(encoding.decode(s)) for s in path], bound
 
 if __name__ == "__main__":
     start_state = [2,8,3,1,6,4,7,0,5]
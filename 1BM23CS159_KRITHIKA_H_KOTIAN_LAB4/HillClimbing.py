@@ -1,4 +1,11 @@
+import multiprocessing
+import os
 import random
+import statistics
+import time
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from operator import add
 
 # ----------------------------------------------------------
 # Function to calculate number of attacking pairs
@@ -32,31 +39,97 @@ def get_neighbors(state):
     return neighbors
 
 
+# ----------------------------------------------------------
+# Board with row / diagonal occupancy counters
+# ----------------------------------------------------------
+class QueensBoard:
+    """
+    One queen per column, state[col] = row. Keeps how many queens sit on
+    each row, diagonal (col - row) and anti-diagonal (col + row), so the
+    change in attacking pairs for moving one queen is found and applied
+    in O(1) instead of rescoring the whole board.
+    """
+
+    def __init__(self, state):
+        n = len(state)
+        self.n = n
+        self.state = list(state)
+        self.rows = [0] * n
+        self.diag = [0] * (2 * n - 1)   # index col - row + n - 1
+        self.anti = [0] * (2 * n - 1)   # index col + row
+        for col, row in enumerate(self.state):
+            self.rows[row] += 1
+            self.diag[col - row + n - 1] += 1
+            self.anti[col + row] += 1
+        # every line holding k queens contributes k*(k-1)/2 attacking pairs
+        self.attacks = sum(k * (k - 1) // 2 for k in self.rows + self.diag + self.anti)
+
+    def conflicts(self, col, row):
+        """Queens (other than the one in col) attacking square (col, row)"""
+        n = self.n
+        count = self.rows[row] + self.diag[col - row + n - 1] + self.anti[col + row]
+        return count - 3 if self.state[col] == row else count
+
+    def delta(self, col, row):
+        """Change in attacking pairs if the queen in col moves to row"""
+        return self.conflicts(col, row) - self.conflicts(col, self.state[col])
+
+    def move(self, col, row):
+        """Move the queen in col to row; returns its old row so it can be undone"""
+        n = self.n
+        old = self.state[col]
+        self.attacks += self.delta(col, row)
+        self.rows[old] -= 1
+        self.diag[col - old + n - 1] -= 1
+        self.anti[col + old] -= 1
+        self.rows[row] += 1
+        self.diag[col - row + n - 1] += 1
+        self.anti[col + row] += 1
+        self.state[col] = row
+        return old
+
+    def best_move(self):
+        """
+        (delta, col, row) of the best single-queen move, first in column
+        then row order on ties, like min() over get_neighbors. The costs
+        of a whole column are summed with map() over list slices: rows
+        0..n-1 of column col lie on diag[col + n - 1 .. col] and
+        anti[col .. col + n - 1].
+        """
+        n = self.n
+        rows, diag, anti, state = self.rows, self.diag, self.anti, self.state
+        best = (float("inf"), None, None)
+        for col in range(n):
+            old = state[col]
+            here = rows[old] + diag[col - old + n - 1] + anti[col + old] - 3
+            costs = list(map(add, map(add, rows, reversed(diag[col:col + n])), anti[col:col + n]))
+            costs[old] = float("inf")
+            low = min(costs)
+            if low - here < best[0]:
+                best = (low - here, col, costs.index(low))
+        return best
+
+
 # ----------------------------------------------------------
 # Basic Hill Climbing search
 # ----------------------------------------------------------
 def hill_climbing(initial_state):
-    current = initial_state
+    board = QueensBoard(initial_state)
     while True:
-        neighbors = get_neighbors(current)
-        neighbor = min(neighbors, key=lambda s: compute_attacking_pairs(s))
-        if compute_attacking_pairs(neighbor) >= compute_attacking_pairs(current):
-            return current
-        current = neighbor
+        delta, col, row = board.best_move()
+        if delta >= 0:
+            return board.state
+        board.move(col, row)
 
 
 # ----------------------------------------------------------
 # Hill Climbing with Random Restarts
 # ----------------------------------------------------------
-def hill_climbing_with_restarts(n=4, max_restarts=100):
+def hill_climbing_with_restarts(n=4, max_restarts=100, seed=None):
+    rng = random.Random(seed) if seed is not None else random
     for restart in range(max_restarts):
-        current = [random.randint(0, n - 1) for _ in range(n)]  # random start
-        while True:
-            neighbors = get_neighbors(current)
-            neighbor = min(neighbors, key=lambda s: compute_attacking_pairs(s))
-            if compute_attacking_pairs(neighbor) >= compute_attacking_pairs(current):
-                break
-            current = neighbor
+        current = [rng.randint(0, n - 1) for _ in range(n)]  # random start
+        current = hill_climbing(current)
 
         # Check if we found a solution
         if compute_attacking_pairs(current) == 0:
@@ -67,6 +140,216 @@ def hill_climbing_with_restarts(n=4, max_restarts=100):
     return None
 
 
+# ----------------------------------------------------------
+# Random restarts spread over a process pool
+# ----------------------------------------------------------
+_stop = None
+
+
+def _init_restart_worker(stop):
+    global _stop
+    _stop = stop
+
+
+def _restart_worker(worker, seed, n, max_restarts):
+    """
+    Restarts with this worker's own generator until a solution, the quota,
+    or another worker setting the shared stop event (checked between
+    restarts, so a running climb always finishes).
+    """
+    rng = random.Random(seed)
+    begin = time.perf_counter()
+    result = {"worker": worker, "seed": seed, "restarts": 0, "solution": None}
+    for restart in range(max_restarts):
+        if _stop is not None and _stop.is_set():
+            break
+        current = hill_climbing([rng.randint(0, n - 1) for _ in range(n)])
+        result["restarts"] = restart + 1
+        if QueensBoard(current).attacks == 0:
+            result["solution"] = current
+            # monotonic() is system-wide, so finish times compare across workers
+            result["found_at"] = time.monotonic()
+            break
+    result["seconds"] = time.perf_counter() - begin
+    return result
+
+
+def parallel_restarts(n=8, max_restarts=1000, workers=None, seed=0, stats=None):
+    """
+    Hill climbing with random restarts spread over a process pool. Worker
+    w gets its own Random seeded from a master Random(seed), so every
+    worker's sequence of restarts is reproducible; which worker finishes
+    first still depends on timing. max_restarts is split between the
+    workers. As soon as one worker returns a zero-attack board the others
+    are told to stop. Several workers can solve before they see the stop
+    event; the winner is the one whose solution was found first by the
+    shared monotonic clock (fewest restarts on a tie). stats gets the
+    restart counts per worker (and their mean, median and max), the
+    winning worker and the seconds from the start to its solution.
+    """
+    workers = workers or os.cpu_count() or 1
+    master = random.Random(seed)
+    seeds = [master.getrandbits(64) for _ in range(workers)]
+    quota = [max_restarts // workers + (w < max_restarts % workers) for w in range(workers)]
+    begin = time.perf_counter()
+    started = time.monotonic()
+    stop = multiprocessing.Event()
+    results = []
+    with ProcessPoolExecutor(workers, initializer=_init_restart_worker,
+                             initargs=(stop,)) as pool:
+        pending = {pool.submit(_restart_worker, w, seeds[w], n, quota[w])
+                   for w in range(workers) if quota[w]}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                results.append(result)
+                if result["solution"] is not None:
+                    stop.set()
+
+    solved = [r for r in results if r["solution"] is not None]
+    first = min(solved, key=lambda r: (r["found_at"], r["restarts"], r["worker"]), default=None)
+    solution = first["solution"] if first else None
+
+    if stats is not None:
+        counts = [r["restarts"] for r in sorted(results, key=lambda r: r["worker"])]
+        stats["seeds"] = seeds
+        stats["restarts"] = counts
+        stats["total_restarts"] = sum(counts)
+        stats["mean_restarts"] = statistics.mean(counts) if counts else 0
+        stats["median_restarts"] = statistics.median(counts) if counts else 0
+        stats["max_restarts"] = max(counts, default=0)
+        stats["winner"] = first["worker"] if first else None
+        stats["seconds_to_solution"] = first["found_at"] - started if first else None
+        stats["seconds"] = time.perf_counter() - begin
+    return solution
+
+
+# ----------------------------------------------------------
+# Min-conflicts repair for very large boards
+# ----------------------------------------------------------
+def min_conflicts(n, max_steps=None, samples=64, tries=32, stall=None, seed=None, stats=None):
+    """
+    Min-conflicts local search that scales to n = 10**6. The board is kept
+    as a permutation (one queen per row and column) in array-backed
+    counters, so only diagonal conflicts remain and moves are swaps of two
+    columns' rows:
+      * greedy start: each column takes a random unused row that is free
+        on both diagonals, trying at most `tries` rows before giving up
+        and leaving a conflict;
+      * repair: pick a random column from the set of conflicted columns
+        and swap it with the first of up to `samples` random partners that
+        lowers the number of attacking pairs, else with one that keeps it
+        equal;
+      * restart from a new greedy start after `stall` steps (default
+        n + 100) without a new best, which only small boards need.
+    Memory is a few int arrays of size 2n. Returns the rows by column, or
+    None if max_steps (default 100n + 10000) run out; stats gets steps,
+    restarts, the conflicted columns left by the first greedy start and
+    the seconds to solution.
+    """
+    rng = random.Random(seed)
+    randrange = rng.randrange
+    begin = time.perf_counter()
+    max_steps = 100 * n + 10000 if max_steps is None else max_steps
+    stall = n + 100 if stall is None else stall
+    off = n - 1
+    rows = array("i", range(n))
+    diag = array("i", bytes(4 * (2 * n - 1)))   # queens on col - row + n - 1
+    anti = array("i", bytes(4 * (2 * n - 1)))   # queens on col + row
+
+    def conflicted(col):
+        row = rows[col]
+        return diag[col - row + off] > 1 or anti[col + row] > 1
+
+    def greedy_start():
+        for i in range(2 * n - 1):
+            diag[i] = anti[i] = 0
+        for col in range(n):
+            for _ in range(tries):
+                k = randrange(col, n)
+                row = rows[k]
+                if not diag[col - row + off] and not anti[col + row]:
+                    break
+            rows[col], rows[k] = rows[k], rows[col]
+            diag[col - row + off] += 1
+            anti[col + row] += 1
+        # conflicted columns as a list for random picks plus membership
+        # flags; columns that stopped conflicting are dropped lazily
+        pending = [col for col in range(n) if conflicted(col)]
+        listed = bytearray(n)
+        for col in pending:
+            listed[col] = 1
+        attacks = sum(k * (k - 1) // 2 for k in diag) + sum(k * (k - 1) // 2 for k in anti)
+        return pending, listed, attacks
+
+    def swap(i, j):
+        """Swap the rows of columns i and j; returns the change in attacking pairs"""
+        ri, rj = rows[i], rows[j]
+        lost = 0
+        for col, row in ((i, ri), (j, rj)):
+            diag[col - row + off] -= 1
+            anti[col + row] -= 1
+            lost += diag[col - row + off] + anti[col + row]
+        gained = 0
+        for col, row in ((i, rj), (j, ri)):
+            gained += diag[col - row + off] + anti[col + row]
+            diag[col - row + off] += 1
+            anti[col + row] += 1
+        rows[i], rows[j] = rj, ri
+        return gained - lost
+
+    pending, listed, attacks = greedy_start()
+    initial = len(pending)
+    best, since_best = attacks, 0
+    steps = restarts = 0
+    while pending and steps < max_steps:
+        steps += 1
+        if since_best > stall:
+            pending, listed, attacks = greedy_start()
+            best, since_best = attacks, 0
+            restarts += 1
+            continue
+        k = randrange(len(pending))
+        i = pending[k]
+        if not conflicted(i):
+            pending[k] = pending[-1]
+            pending.pop()
+            listed[i] = 0
+            continue
+        since_best += 1
+        sideways = None
+        for _ in range(samples):
+            j = randrange(n)
+            if j == i:
+                continue
+            delta = swap(i, j)
+            if delta < 0:
+                break
+            swap(i, j)
+            if delta == 0 and sideways is None:
+                sideways = j
+        else:
+            if sideways is None:
+                continue
+            j = sideways
+            delta = swap(i, j)
+        attacks += delta
+        if attacks < best:
+            best, since_best = attacks, 0
+        if conflicted(j) and not listed[j]:
+            listed[j] = 1
+            pending.append(j)
+
+    solved = not pending
+    if stats is not None:
+        stats["steps"] = steps
+        stats["restarts"] = restarts
+        stats["initial_conflicts"] = initial
+        stats["seconds"] = time.perf_counter() - begin
+    return list(rows) if solved else None
+
+
 # ----------------------------------------------------------
 # Print board nicely
 # ----------------------------------------------------------
@@ -102,3 +385,17 @@ if __name__ == "__main__":
     if solution:
         print("Final State:", solution, "with", compute_attacking_pairs(solution), "attacks")
         print_board(solution)
+
+    # Min-conflicts on a board far too large for the neighbor lists
+    print("=== Min-Conflicts on 100000 queens ===")
+    stats = {}
+    solution = min_conflicts(100000, seed=1, stats=stats)
+    print("Solved:", solution is not None, "in", stats["steps"], "steps,",
+          f"{stats['seconds']:.2f}s")
+
+    # Restarts spread over every core
+    print("=== Parallel Random Restarts on 8 queens ===")
+    stats = {}
+    solution = parallel_restarts(n=8, max_restarts=1000, seed=1, stats=stats)
+    print("Solution:", solution, "from worker", stats["winner"], "after",
+          stats["total_restarts"], "restarts in total,", f"{stats['seconds']:.2f}s")
@@ -0,0 +1,441 @@
+import csv
+import math
+import random
+import time
+from array import array
+from collections import deque
+
+from HillClimbing import QueensBoard, compute_attacking_pairs, print_board
+
+
+# ----------------------------------------------------------
+# Problem interface
+# ----------------------------------------------------------
+class LocalSearchProblem:
+    """
+    What the strategies below need from a problem. The problem object is
+    the current state and is changed in place: a move is applied with
+    apply(move), which returns a token that undo(token) uses to restore
+    the previous state, and delta(move) gives the cost change of a move
+    without making it. Lower cost is better.
+    """
+
+    cost = 0
+
+    def moves(self):
+        """Every move from the current state"""
+        raise NotImplementedError
+
+    def random_move(self, rng):
+        raise NotImplementedError
+
+    def delta(self, move):
+        """Cost change of move; by default found by applying it and rolling back"""
+        before = self.cost
+        token = self.apply(move)
+        after = self.cost
+        self.undo(token)
+        return after - before
+
+    def apply(self, move):
+        raise NotImplementedError
+
+    def undo(self, token):
+        raise NotImplementedError
+
+    def snapshot(self):
+        """A copy of the current state that later moves do not change"""
+        raise NotImplementedError
+
+    def tabu_key(self, move):
+        """Attribute that tabu search forbids undoing for a while; the move itself by default"""
+        return move
+
+    def reverse_key(self, move):
+        """Key under which the reverse of move (made now) would be recorded"""
+        return move
+
+    def best_move(self, rng):
+        """(delta, move) of a best move, ties broken at random; None without moves"""
+        best, choices = None, []
+        for move in self.moves():
+            d = self.delta(move)
+            if best is None or d < best:
+                best, choices = d, [move]
+            elif d == best:
+                choices.append(move)
+        return None if best is None else (best, rng.choice(choices))
+
+
+class NQueensProblem(LocalSearchProblem):
+    """N-Queens on the O(1) conflict counters of QueensBoard; a move is (col, row)"""
+
+    def __init__(self, state):
+        self.board = QueensBoard(state)
+        self.n = self.board.n
+
+    @property
+    def cost(self):
+        return self.board.attacks
+
+    def moves(self):
+        n, state = self.n, self.board.state
+        return ((col, row) for col in range(n) for row in range(n) if row != state[col])
+
+    def random_move(self, rng):
+        col = rng.randrange(self.n)
+        row = rng.randrange(self.n - 1)
+        return col, row + (row >= self.board.state[col])
+
+    def delta(self, move):
+        return self.board.delta(*move)
+
+    def apply(self, move):
+        col, row = move
+        return col, self.board.move(col, row)
+
+    def undo(self, token):
+        self.board.move(*token)
+
+    def snapshot(self):
+        return list(self.board.state)
+
+    def reverse_key(self, move):
+        # forbids moving this queen back onto the row it is leaving
+        return move[0], self.board.state[move[0]]
+
+
+# ----------------------------------------------------------
+# Strategies: each takes a problem and returns (best state, best cost)
+# ----------------------------------------------------------
+def _finish(problem, best, best_cost, stats, steps, begin):
+    if stats is not None:
+        stats["steps"] = steps
+        stats["cost"] = best_cost
+        stats["seconds"] = time.perf_counter() - begin
+    return best, best_cost
+
+
+def steepest_ascent(problem, max_sideways=0, max_steps=None, seed=None, stats=None):
+    """
+    Take the best move while it improves the cost. With max_sideways > 0,
+    up to that many equal-cost moves in a row are allowed to cross
+    plateaus; the count resets on every improvement.
+    """
+    rng = random.Random(seed)
+    begin = time.perf_counter()
+    best, best_cost = problem.snapshot(), problem.cost
+    steps = sideways = 0
+    while max_steps is None or steps < max_steps:
+        found = problem.best_move(rng)
+        if found is None:
+            break
+        delta, move = found
+        if delta > 0 or (delta == 0 and sideways >= max_sideways):
+            break
+        sideways = sideways + 1 if delta == 0 else 0
+        problem.apply(move)
+        steps += 1
+        if problem.cost < best_cost:
+            best, best_cost = problem.snapshot(), problem.cost
+        if best_cost == 0:
+            break
+    return _finish(problem, best, best_cost, stats, steps, begin)
+
+
+def first_choice(problem, max_tries=1000, max_steps=None, seed=None, stats=None):
+    """
+    Stochastic hill climbing: draw random moves and take the first that
+    improves; stop after max_tries draws in a row without one.
+    """
+    rng = random.Random(seed)
+    begin = time.perf_counter()
+    steps = 0
+    while problem.cost > 0 and (max_steps is None or steps < max_steps):
+        for _ in range(max_tries):
+            move = problem.random_move(rng)
+            if problem.delta(move) < 0:
+                problem.apply(move)
+                steps += 1
+                break
+        else:
+            break
+    return _finish(problem, problem.snapshot(), problem.cost, stats, steps, begin)
+
+
+def tabu_search(problem, tenure=10, max_steps=1000, seed=None, stats=None):
+    """
+    Always take the best move whose tabu key is not among the last `tenure`
+    reverse keys, even if it makes things worse. A tabu move is still
+    allowed when it would beat the best cost seen (aspiration). With
+    tenure=0 nothing is tabu and this is steepest descent that also takes
+    worsening moves.
+    """
+    if tenure < 0:
+        raise ValueError(f"tenure must be >= 0, got {tenure}")
+    rng = random.Random(seed)
+    begin = time.perf_counter()
+    best, best_cost = problem.snapshot(), problem.cost
+    recent = deque(maxlen=tenure)
+    tabu = {}
+    steps = 0
+    while best_cost > 0 and steps < max_steps:
+        choice, choices = None, []
+        for move in problem.moves():
+            d = problem.delta(move)
+            if tabu.get(problem.tabu_key(move)) and problem.cost + d >= best_cost:
+                continue
+            if choice is None or d < choice:
+                choice, choices = d, [move]
+            elif d == choice:
+                choices.append(move)
+        if choice is None:
+            break
+        move = rng.choice(choices)
+        if tenure:
+            key = problem.reverse_key(move)
+            if len(recent) == tenure:
+                old = recent[0]
+                tabu[old] -= 1
+                if not tabu[old]:
+                    del tabu[old]
+            recent.append(key)
+            tabu[key] = tabu.get(key, 0) + 1
+        problem.apply(move)
+        steps += 1
+        if problem.cost < best_cost:
+            best, best_cost = problem.snapshot(), problem.cost
+    return _finish(problem, best, best_cost, stats, steps, begin)
+
+
+def simulated_annealing(problem, schedule=None, T=1000, cooling_rate=0.99, min_T=0.1,
+                        seed=None, stats=None, trace=None):
+    """
+    Random moves, always kept when they do not raise the cost and kept with
+    probability exp(-delta / T) otherwise. Only the O(1) delta of each
+    proposal is computed, and the move is made in place only when it is
+    accepted. The temperature comes from schedule (geometric cooling from
+    T to min_T by default); the run stops when the schedule ends or the
+    cost reaches 0. Pass an AnnealingTrace as trace to sample the run.
+    """
+    if schedule is None:
+        schedule = GeometricSchedule(T, cooling_rate, min_T)
+    rng = random.Random(seed)
+    rand, exp = rng.random, math.exp
+    begin = time.perf_counter()
+    best, best_cost = problem.snapshot(), problem.cost
+    cost = best_cost
+    steps = accepted = 0
+    # without a trace, steps never equals -1 and sampling costs one compare
+    sample_at = -1
+    if trace is not None:
+        trace.start(best_cost)
+        sample_at = trace.stride
+    running = best_cost > 0
+    while running:
+        T = schedule.temperature
+        move = problem.random_move(rng)
+        delta = problem.delta(move)
+        keep = delta <= 0 or rand() < exp(-delta / T)
+        improved = False
+        if keep:
+            problem.apply(move)
+            accepted += 1
+            cost += delta
+            if cost < best_cost:
+                best, best_cost = problem.snapshot(), cost
+                improved = True
+                if trace is not None:
+                    trace.new_best(steps + 1, cost)
+        steps += 1
+        if steps == sample_at:
+            trace.record(steps, T, cost, best_cost, accepted)
+            sample_at += trace.stride
+        running = schedule.step(keep, improved) and best_cost > 0
+    if trace is not None and steps != sample_at - trace.stride:
+        trace.record(steps, schedule.temperature, cost, best_cost, accepted)
+    if stats is not None:
+        stats["accepted"] = accepted
+        stats["temperature"] = schedule.temperature
+        stats["reheats"] = getattr(schedule, "reheats", 0)
+    return _finish(problem, best, best_cost, stats, steps, begin)
+
+
+# ----------------------------------------------------------
+# Annealing schedules: .temperature is the current temperature,
+# step(accepted, improved) advances one proposal and returns False
+# once the schedule is over
+# ----------------------------------------------------------
+class GeometricSchedule:
+    """T <- T * cooling_rate after every proposal, until T <= min_T"""
+
+    def __init__(self, T=1000, cooling_rate=0.99, min_T=0.1):
+        self.temperature = T
+        self.cooling_rate = cooling_rate
+        self.min_T = min_T
+
+    def step(self, accepted, improved):
+        self.temperature *= self.cooling_rate
+        return self.temperature > self.min_T
+
+
+class AdaptiveSchedule:
+    """
+    Steers T so that the share of accepted proposals over each window
+    follows a target that decays geometrically from target to
+    final_target over max_steps: T is divided by adjust when too many
+    proposals were accepted and multiplied by it when too few.
+    """
+
+    def __init__(self, T=10.0, target=0.5, final_target=0.01, max_steps=100000,
+                 window=100, adjust=1.1):
+        self.temperature = T
+        self.target = target
+        self.final_target = final_target
+        self.max_steps = max_steps
+        self.window = window
+        self.adjust = adjust
+        self.steps = 0
+        self.accepted = 0
+
+    def step(self, accepted, improved):
+        self.steps += 1
+        self.accepted += accepted
+        if self.steps % self.window == 0:
+            progress = self.steps / self.max_steps
+            goal = self.target * (self.final_target / self.target) ** progress
+            if self.accepted > goal * self.window:
+                self.temperature /= self.adjust
+            else:
+                self.temperature *= self.adjust
+            self.accepted = 0
+        return self.steps < self.max_steps
+
+
+class ReheatingSchedule(GeometricSchedule):
+    """
+    Geometric cooling that raises T back to reheat_T (half the starting
+    temperature by default) after `patience` proposals without a new best,
+    or when it freezes, at most max_reheats times.
+    """
+
+    def __init__(self, T=1000, cooling_rate=0.99, min_T=0.1, patience=1000,
+                 reheat_T=None, max_reheats=10):
+        super().__init__(T, cooling_rate, min_T)
+        self.patience = patience
+        self.reheat_T = T / 2 if reheat_T is None else reheat_T
+        self.max_reheats = max_reheats
+        self.reheats = 0
+        self.stale = 0
+
+    def step(self, accepted, improved):
+        self.stale = 0 if improved else self.stale + 1
+        running = super().step(accepted, improved)
+        if (self.stale >= self.patience or not running) and self.reheats < self.max_reheats:
+            self.temperature = self.reheat_T
+            self.reheats += 1
+            self.stale = 0
+            running = True
+        return running
+
+
+# ----------------------------------------------------------
+# Annealing telemetry
+# ----------------------------------------------------------
+class AnnealingTrace:
+    """
+    Samples an annealing run every `stride` proposals into a ring buffer
+    of the last `capacity` samples. The buffer is allocated up front as
+    flat arrays, so recording never allocates. Each sample holds the step,
+    temperature, current and best cost, and the share of proposals
+    accepted since the previous sample. New bests are timed as they
+    happen, for time_to_best().
+    """
+
+    FIELDS = ("step", "temperature", "cost", "best", "acceptance")
+
+    def __init__(self, stride=100, capacity=10000):
+        self.stride = stride
+        self.capacity = capacity
+        self.columns = {name: array("d", bytes(8 * capacity)) for name in self.FIELDS}
+        self.count = 0
+
+    def start(self, cost):
+        self.count = 0
+        self.last_step = self.last_accepted = 0
+        self.begin = time.perf_counter()
+        self.best_cost, self.best_step, self.best_seconds = cost, 0, 0.0
+        self.initial_cost = cost
+
+    def new_best(self, step, cost):
+        self.best_cost, self.best_step = cost, step
+        self.best_seconds = time.perf_counter() - self.begin
+
+    def record(self, step, temperature, cost, best, accepted):
+        i = self.count % self.capacity
+        columns = self.columns
+        columns["step"][i] = step
+        columns["temperature"][i] = temperature
+        columns["cost"][i] = cost
+        columns["best"][i] = best
+        columns["acceptance"][i] = (accepted - self.last_accepted) / max(step - self.last_step, 1)
+        self.last_step, self.last_accepted = step, accepted
+        self.count += 1
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def _order(self):
+        """Buffer slots oldest first"""
+        if self.count <= self.capacity:
+            return range(self.count)
+        start = self.count % self.capacity
+        return [(start + i) % self.capacity for i in range(self.capacity)]
+
+    def samples(self):
+        """The kept samples, oldest first, as dicts"""
+        columns = self.columns
+        return [{name: columns[name][i] for name in self.FIELDS} for i in self._order()]
+
+    def to_numpy(self):
+        """Kept samples as a structured NumPy array (NumPy is imported only here)"""
+        import numpy as np
+        order = np.fromiter(self._order(), dtype=np.intp, count=len(self))
+        table = np.empty(len(self), dtype=[(name, "f8") for name in self.FIELDS])
+        for name in self.FIELDS:
+            table[name] = np.frombuffer(self.columns[name], dtype="f8")[order]
+        return table
+
+    def to_csv(self, path):
+        columns = self.columns
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.FIELDS)
+            for i in self._order():
+                writer.writerow([columns[name][i] for name in self.FIELDS])
+
+    def time_to_best(self):
+        """Step and seconds at which the final best cost was first reached"""
+        return {"initial_cost": self.initial_cost, "best_cost": self.best_cost,
+                "step": self.best_step, "seconds": self.best_seconds}
+
+
+STRATEGIES = {
+    "steepest": steepest_ascent,
+    "first-choice": first_choice,
+    "tabu": tabu_search,
+    "annealing": simulated_annealing,
+}
+
+
+if __name__ == "__main__":
+    n = 8
+    rng = random.Random(0)
+    initial_state = [rng.randrange(n) for _ in range(n)]
+    print("Initial State:", initial_state, "with", compute_attacking_pairs(initial_state), "attacks")
+    for name, strategy in STRATEGIES.items():
+        options = {"max_sideways": 100} if name == "steepest" else {}
+        stats = {}
+        state, cost = strategy(NQueensProblem(initial_state), seed=0, stats=stats, **options)
+        print(f"{name:13} {cost} attacks after {stats['steps']} steps: {state}")
+    print_board(state)
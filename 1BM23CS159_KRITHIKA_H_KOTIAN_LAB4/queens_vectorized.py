@@ -0,0 +1,105 @@
+import time
+
+import numpy as np
+
+
+class VectorQueensBoard:
+    """
+    N-Queens board (state[col] = row) that keeps the full n x n move-cost
+    matrix as a NumPy array: cost[c, r] is the number of queens on row r,
+    diagonal c - r and anti-diagonal c + r. Moving queen c to row r then
+    changes the number of attacking pairs by cost[c, r] - (cost[c, state[c]] - 3),
+    so a steepest-ascent step is one argmin over the matrix. After a move
+    only the two rows, two diagonals and two anti-diagonals it touched are
+    updated, each a strided slice of the matrix.
+    """
+
+    def __init__(self, state, seed=None):
+        n = len(state)
+        self.n = n
+        self.rng = np.random.default_rng(seed)
+        self.state = np.array(state, dtype=np.intp)
+        cols = np.arange(n)
+        self.cols = cols
+        self.rows = np.bincount(self.state, minlength=n)
+        self.diag = np.bincount(cols - self.state + n - 1, minlength=2 * n - 1)
+        self.anti = np.bincount(cols + self.state, minlength=2 * n - 1)
+        c, r = cols[:, None], cols[None, :]
+        self.cost = (self.rows[r] + self.diag[c - r + n - 1] + self.anti[c + r]).astype(np.int32)
+        self.attacks = int(sum((k * (k - 1) // 2).sum() for k in (self.rows, self.diag, self.anti)))
+
+    def move_costs(self):
+        """deltas[c, r] = change in attacking pairs for moving queen c to row r (huge for r = state[c])"""
+        cols, state = self.cols, self.state
+        deltas = self.cost - (self.cost[cols, state] - 3)[:, None]
+        deltas[cols, state] = np.iinfo(np.int32).max
+        return deltas
+
+    def best_move(self):
+        """(delta, col, row) of a best move, ties broken uniformly at random"""
+        deltas = self.move_costs()
+        best = deltas.min()
+        ties = np.flatnonzero(deltas == best)
+        col, row = divmod(int(ties[self.rng.integers(len(ties))]), self.n)
+        return int(best), col, row
+
+    def _diagonal(self, index):
+        """(cols, rows) of the cells with c - r + n - 1 == index"""
+        k = index - (self.n - 1)
+        cols = np.arange(max(0, k), min(self.n, self.n + k))
+        return cols, cols - k
+
+    def _anti_diagonal(self, index):
+        """(cols, rows) of the cells with c + r == index"""
+        cols = np.arange(max(0, index - self.n + 1), min(self.n, index + 1))
+        return cols, index - cols
+
+    def _shift(self, col, row, step):
+        n, cost = self.n, self.cost
+        d, a = col - row + n - 1, col + row
+        self.rows[row] += step
+        self.diag[d] += step
+        self.anti[a] += step
+        cost[:, row] += step
+        cost[self._diagonal(d)] += step
+        cost[self._anti_diagonal(a)] += step
+
+    def move(self, col, row):
+        """Move the queen in col to row; returns its old row so it can be undone"""
+        old = int(self.state[col])
+        self.attacks += int(self.cost[col, row]) - (int(self.cost[col, old]) - 3)
+        self._shift(col, old, -1)
+        self._shift(col, row, +1)
+        self.state[col] = row
+        return old
+
+
+def hill_climbing_vectorized(initial_state, seed=None, max_steps=None, stats=None):
+    """
+    Steepest-ascent hill climbing on a VectorQueensBoard; stops at the
+    first state with no improving move. Returns the final state as a list.
+    """
+    board = VectorQueensBoard(initial_state, seed)
+    begin = time.perf_counter()
+    steps = 0
+    while max_steps is None or steps < max_steps:
+        delta, col, row = board.best_move()
+        if delta >= 0:
+            break
+        board.move(col, row)
+        steps += 1
+    if stats is not None:
+        stats["steps"] = steps
+        stats["attacks"] = board.attacks
+        stats["seconds"] = time.perf_counter() - begin
+    return board.state.tolist()
+
+
+if __name__ == "__main__":
+    n = 500
+    rng = np.random.default_rng(0)
+    initial_state = rng.integers(n, size=n).tolist()
+    stats = {}
+    final = hill_climbing_vectorized(initial_state, seed=0, stats=stats)
+    print(f"{n} queens: {stats['attacks']} attacks left after {stats['steps']} steps "
+          f"({1000 * stats['seconds'] / max(stats['steps'], 1):.1f} ms per step)")
@@ -1,19 +1,13 @@
 import math
+import os
 import random
+import sys
 
-# Function to calculate number of attacking pairs
-def compute_attacking_pairs(state):
-    attacks = 0
-    n = len(state)
-    for i in range(n):
-        for j in range(i+1, n):
-            # same column
-            if state[i] == state[j]:
-                attacks += 1
-            # same diagonal
-            elif abs(state[i] - state[j]) == abs(i - j):
-                attacks += 1
-    return attacks
+# N-Queens scoring and the local-search framework live in LAB4
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "1BM23CS159_KRITHIKA_H_KOTIAN_LAB4"))
+import local_search
+from HillClimbing import compute_attacking_pairs
 
 # Generate a random neighbor by moving one queen
 def random_neighbor(state):
@@ -58,6 +52,18 @@ def print_board(state):
         print(line)
     print("\n")
 
+# Simulated annealing on O(1) conflict counters: proposals are scored by
+# their delta, the board is changed in place only on acceptance, and the
+# run stops as soon as no queens attack each other
+def simulated_annealing_incremental(initial_state, schedule=None, seed=None, stats=None, trace=None):
+    n = len(initial_state)
+    if schedule is None:
+        # about 5000 proposals per queen from T=2 down to T=0.01
+        schedule = local_search.GeometricSchedule(2.0, 1 - 1 / (1000 * n), 0.01)
+    state, cost = local_search.simulated_annealing(local_search.NQueensProblem(initial_state),
+                                                   schedule, seed=seed, stats=stats, trace=trace)
+    return state
+
 # Example usage
 if __name__ == "__main__":
     n = 8
@@ -69,3 +75,25 @@ if __name__ == "__main__":
 
     print("Final State:", solution, "with", compute_attacking_pairs(solution), "attacks")
     print_board(solution)
+
+    # Incremental annealing under each schedule on a larger board
+    n = 100
+    board = [random.randint(0, n-1) for _ in range(n)]
+    schedules = {
+        "geometric": None,
+        "adaptive": local_search.AdaptiveSchedule(T=1.0, target=0.2, final_target=0.001,
+                                                  max_steps=500000),
+        "reheating": local_search.ReheatingSchedule(1.0, 0.9999, 0.05, patience=20000),
+    }
+    for name, schedule in schedules.items():
+        stats = {}
+        state = simulated_annealing_incremental(board, schedule, stats=stats)
+        print(f"{name:10} {n} queens: {stats['cost']} attacks after {stats['steps']} steps "
+              f"({stats['seconds']:.2f}s)")
+
+    # Sample the geometric run every 1000 proposals for schedule tuning
+    trace = local_search.AnnealingTrace(stride=1000)
+    simulated_annealing_incremental(board, trace=trace)
+    best = trace.time_to_best()
+    print(f"best of {best['best_cost']} attacks first reached at step {best['step']} "
+          f"({best['seconds']:.2f}s), {len(trace)} samples kept")
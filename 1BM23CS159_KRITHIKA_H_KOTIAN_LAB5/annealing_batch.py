@@ -0,0 +1,148 @@
+import time
+
+import numpy as np
+
+
+class QueensChains:
+    """
+    K independent N-Queens boards advanced in lockstep. states has shape
+    (K, n) with states[k, col] = row; the row, diagonal and anti-diagonal
+    queen counts of every board are (K, n) and (K, 2n - 1) arrays, so one
+    proposal per chain is scored and applied with a handful of fancy-
+    indexing operations over all chains at once.
+    """
+
+    def __init__(self, states):
+        self.states = np.array(states, dtype=np.intp)
+        K, n = self.states.shape
+        self.n = n
+        self.chains = np.arange(K)
+        cols = np.arange(n)
+        self.rows = np.zeros((K, n), dtype=np.int32)
+        self.diag = np.zeros((K, 2 * n - 1), dtype=np.int32)
+        self.anti = np.zeros((K, 2 * n - 1), dtype=np.int32)
+        chain = self.chains[:, None]
+        np.add.at(self.rows, (chain, self.states), 1)
+        np.add.at(self.diag, (chain, cols - self.states + n - 1), 1)
+        np.add.at(self.anti, (chain, cols + self.states), 1)
+        self.energy = sum((c * (c - 1) // 2).sum(axis=1) for c in (self.rows, self.diag, self.anti))
+
+    def _count(self, cols, rows):
+        k, n = self.chains, self.n
+        return self.rows[k, rows] + self.diag[k, cols - rows + n - 1] + self.anti[k, cols + rows]
+
+    def _shift(self, keep, cols, rows, step):
+        k, n = self.chains[keep], self.n
+        cols, rows = cols[keep], rows[keep]
+        self.rows[k, rows] += step
+        self.diag[k, cols - rows + n - 1] += step
+        self.anti[k, cols + rows] += step
+
+    def step(self, temperatures, rng):
+        """
+        One Metropolis step per chain: move a random queen to a random other
+        row and keep it with probability min(1, exp(-delta / T)). Returns
+        the boolean mask of accepted moves.
+        """
+        K, n = len(self.chains), self.n
+        cols = rng.integers(n, size=K)
+        old = self.states[self.chains, cols]
+        new = rng.integers(n - 1, size=K)
+        new += new >= old
+        delta = self._count(cols, new) - (self._count(cols, old) - 3)
+        with np.errstate(over="ignore"):
+            keep = (delta <= 0) | (rng.random(K) < np.exp(-delta / temperatures))
+        self._shift(keep, cols, old, -1)
+        self._shift(keep, cols, new, +1)
+        self.states[self.chains[keep], cols[keep]] = new[keep]
+        self.energy += np.where(keep, delta, 0)
+        return keep
+
+
+def _random_chains(n, K, rng):
+    return QueensChains(rng.integers(n, size=(K, n)))
+
+
+def _track_best(chains, best_state, best_energy):
+    k = int(np.argmin(chains.energy))
+    if chains.energy[k] < best_energy:
+        return chains.states[k].tolist(), int(chains.energy[k])
+    return best_state, best_energy
+
+
+def batch_annealing(n=8, chains=1000, T=2.0, cooling_rate=0.999, min_T=0.01, seed=None, stats=None):
+    """
+    Simulated annealing on `chains` random boards at once, all on the same
+    geometric schedule. Stops when the schedule ends or any chain reaches
+    zero attacks. Returns (best state, its attacking pairs).
+    """
+    rng = np.random.default_rng(seed)
+    begin = time.perf_counter()
+    board = _random_chains(n, chains, rng)
+    best_state, best_energy = _track_best(board, None, np.inf)
+    steps = accepted = 0
+    while T > min_T and best_energy > 0:
+        accepted += int(board.step(T, rng).sum())
+        best_state, best_energy = _track_best(board, best_state, best_energy)
+        T *= cooling_rate
+        steps += 1
+    if stats is not None:
+        stats["steps"] = steps
+        stats["acceptance"] = accepted / (steps * chains) if steps else 0.0
+        stats["solved_chains"] = int((board.energy == 0).sum())
+        stats["seconds"] = time.perf_counter() - begin
+    return best_state, best_energy
+
+
+def parallel_tempering(n=8, replicas=16, T_min=0.05, T_max=3.0, max_steps=100000,
+                       swap_every=10, seed=None, stats=None):
+    """
+    Replica exchange: one chain per temperature of a geometric ladder from
+    T_min to T_max, all stepped together. Every swap_every steps,
+    neighbouring rungs (alternately the even and the odd pairs) exchange
+    temperatures with probability min(1, exp((E_a - E_b) * (1/T_a - 1/T_b))),
+    so good boards drift down to the cold rungs and stuck ones get heated.
+    Returns (best state, its attacking pairs).
+    """
+    rng = np.random.default_rng(seed)
+    begin = time.perf_counter()
+    board = _random_chains(n, replicas, rng)
+    ladder = T_min * (T_max / T_min) ** (np.arange(replicas) / max(replicas - 1, 1))
+    order = np.arange(replicas)          # order[r] = chain at rung r
+    temperatures = ladder.copy()         # temperature of each chain
+    best_state, best_energy = _track_best(board, None, np.inf)
+    steps = swaps = attempts = 0
+    while steps < max_steps and best_energy > 0:
+        board.step(temperatures, rng)
+        best_state, best_energy = _track_best(board, best_state, best_energy)
+        steps += 1
+        if steps % swap_every == 0 and replicas > 1:
+            first = (steps // swap_every) % 2
+            low = np.arange(first, replicas - 1, 2)
+            a, b = order[low], order[low + 1]
+            energy = board.energy
+            chance = (energy[a] - energy[b]) * (1 / ladder[low] - 1 / ladder[low + 1])
+            with np.errstate(over="ignore"):
+                swap = rng.random(len(low)) < np.exp(np.minimum(chance, 0))
+            order[low[swap]], order[low[swap] + 1] = b[swap], a[swap]
+            temperatures[order] = ladder
+            attempts += len(low)
+            swaps += int(swap.sum())
+    if stats is not None:
+        stats["steps"] = steps
+        stats["swap_rate"] = swaps / attempts if attempts else 0.0
+        stats["seconds"] = time.perf_counter() - begin
+    return best_state, best_energy
+
+
+if __name__ == "__main__":
+    stats = {}
+    state, energy = batch_annealing(8, chains=1000, seed=0, stats=stats)
+    print(f"batch annealing, 1000 chains: {energy} attacks after {stats['steps']} steps, "
+          f"{stats['solved_chains']} chains solved ({stats['seconds']:.2f}s)")
+    print(state)
+
+    stats = {}
+    state, energy = parallel_tempering(64, replicas=16, seed=0, stats=stats)
+    print(f"parallel tempering, 64 queens: {energy} attacks after {stats['steps']} steps, "
+          f"swap rate {stats['swap_rate']:.2f} ({stats['seconds']:.2f}s)")
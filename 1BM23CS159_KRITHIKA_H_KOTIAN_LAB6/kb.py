@@ -1,6 +1,142 @@
+import functools
 import itertools
 import re
 
+TOKEN = re.compile(r"\s*(<->|->|[~^()]|\w+)")
+
+# ----------------------------------------------------------
+# Parsing: expressions become nested tuples, parsed once per string
+# ----------------------------------------------------------
+def tokenize(expr):
+    tokens = []
+    pos = 0
+    expr = expr.rstrip()
+    while pos < len(expr):
+        match = TOKEN.match(expr, pos)
+        if not match:
+            raise SyntaxError(f"unexpected {expr[pos:].strip()!r} in {expr!r}")
+        tokens.append(match.group(1))
+        pos = match.end()
+    return tokens
+
+
+@functools.lru_cache(maxsize=None)
+def parse(expr):
+    """
+    Parse into ("sym", name), ("not", a), ("and", a, b), ("or", a, b),
+    ("implies", a, b) or ("iff", a, b). Binding from tightest to loosest:
+    ~, ^, v, ->, <->; implication groups to the right.
+    """
+    tokens = tokenize(expr)
+    pos = 0
+
+    def peek():
+        return tokens[pos] if pos < len(tokens) else None
+
+    def take(expected=None):
+        nonlocal pos
+        token = peek()
+        if token is None or (expected is not None and token != expected):
+            raise SyntaxError(f"expected {expected or 'an operand'} in {expr!r}")
+        pos += 1
+        return token
+
+    def iff():
+        left = implies()
+        while peek() == "<->":
+            take()
+            left = ("iff", left, implies())
+        return left
+
+    def implies():
+        left = disjunction()
+        if peek() == "->":
+            take()
+            return ("implies", left, implies())
+        return left
+
+    def disjunction():
+        left = conjunction()
+        while peek() == "v":
+            take()
+            left = ("or", left, conjunction())
+        return left
+
+    def conjunction():
+        left = negation()
+        while peek() == "^":
+            take()
+            left = ("and", left, negation())
+        return left
+
+    def negation():
+        token = take()
+        if token == "~":
+            return ("not", negation())
+        if token == "(":
+            inner = iff()
+            take(")")
+            return inner
+        if token in ("v", "^", ")", "->", "<->"):
+            raise SyntaxError(f"unexpected {token!r} in {expr!r}")
+        return ("sym", token)
+
+    tree = iff()
+    if peek() is not None:
+        raise SyntaxError(f"unexpected {peek()!r} in {expr!r}")
+    return tree
+
+
+def symbols_in(tree, found=None):
+    found = set() if found is None else found
+    if tree[0] == "sym":
+        found.add(tree[1])
+    else:
+        for child in tree[1:]:
+            symbols_in(child, found)
+    return found
+
+
+# ----------------------------------------------------------
+# Bit-parallel evaluation: bit i of a column is the value in model i
+# ----------------------------------------------------------
+def evaluate_bits(tree, columns, ones):
+    """Truth column of tree given each symbol's column; ones has a bit for every model"""
+    op = tree[0]
+    if op == "sym":
+        return columns[tree[1]]
+    if op == "not":
+        return ones ^ evaluate_bits(tree[1], columns, ones)
+    a = evaluate_bits(tree[1], columns, ones)
+    b = evaluate_bits(tree[2], columns, ones)
+    if op == "and":
+        return a & b
+    if op == "or":
+        return a | b
+    if op == "implies":
+        return (ones ^ a) | b
+    return ones ^ (a ^ b)
+
+
+def truth_columns(symbols):
+    """
+    Columns over all 2^n models in itertools.product([True, False]) order:
+    model i gives symbol j the value True when bit n-1-j of i is 0, so its
+    column is runs of 2^(n-1-j) ones and zeros, built by doubling.
+    """
+    n = len(symbols)
+    total = 1 << n
+    columns = {}
+    for j, sym in enumerate(symbols):
+        run = 1 << (n - 1 - j)
+        column, length = (1 << run) - 1, 2 * run
+        while length < total:
+            column |= column << length
+            length *= 2
+        columns[sym] = column
+    return columns
+
+
 def evaluate(expr, model):
     """
     Evaluate a propositional logic expression under a given model (assignment).
@@ -11,70 +147,81 @@ def evaluate(expr, model):
       ->: IMPLIES
       <->: BICONDITIONAL
     """
+    columns = {sym: int(bool(val)) for sym, val in model.items()}
+    return bool(evaluate_bits(parse(expr), columns, 1))
 
-    # Replace biconditional and implication first
-    expr = expr.replace("<->", " == ")
-    expr = expr.replace("->", " <= ")
-
-    # Replace negation ~ with explicit parentheses (not X)
-    expr = re.sub(r'~(\w+)', r'(not \1)', expr)
-    expr = re.sub(r'~\(([^)]+)\)', r'(not (\1))', expr)
 
-    # Replace AND and OR
-    expr = expr.replace("^", " and ")
-    expr = expr.replace("v", " or ")
-
-    # Replace symbols with their boolean values in the model
-    for sym, val in model.items():
-        expr = re.sub(r'\b' + re.escape(sym) + r'\b', str(val), expr)
-
-    # Evaluate the final Python boolean expression
-    return eval(expr)
-
-
-def tt_entails(kb, query, symbols):
+def entails(kb, query, symbols, chunk_symbols=24):
+    """
+    KB entails query iff no model has KB true and query false, i.e.
+    KB & ~query == 0 over all 2^n models at once. Beyond chunk_symbols
+    symbols the leading ones are fixed to each of their assignments in
+    turn, so the columns never exceed 2^chunk_symbols bits (2 MB at 24).
+    Returns (entails, index of the first counter-model or None).
+    """
+    kb_tree, query_tree = parse(kb), parse(query)
+    missing = (symbols_in(kb_tree) | symbols_in(query_tree)) - set(symbols)
+    if missing:
+        raise ValueError(f"symbols not listed: {sorted(missing)}")
+    split = max(0, len(symbols) - chunk_symbols)
+    fixed, free = list(symbols[:split]), list(symbols[split:])
+    columns = truth_columns(free)
+    ones = (1 << (1 << len(free))) - 1
+    for chunk, values in enumerate(itertools.product([True, False], repeat=len(fixed))):
+        columns.update((sym, ones if val else 0) for sym, val in zip(fixed, values))
+        bad = evaluate_bits(kb_tree, columns, ones) & ~evaluate_bits(query_tree, columns, ones)
+        if bad:
+            first = (bad & -bad).bit_length() - 1
+            return False, (chunk << len(free)) + first
+    return True, None
+
+
+def tt_entails(kb, query, symbols, show_table=True):
     """
     Truth-table enumeration to check if KB entails Query.
     Prints the truth table and returns True if entails, else False.
+    The check itself runs bit-parallel (see entails); the table is
+    printed from the same truth columns, so show_table=False skips the
+    2^n printed rows for large symbol sets.
     """
 
-    entails = True
-    models = list(itertools.product([True, False], repeat=len(symbols)))
+    result, counter_model = entails(kb, query, symbols)
 
-    print("Truth Table Evaluation:\n")
-    header = " | ".join(symbols) + " | KB | Query | KB ⇒ Query"
-    print(header)
-    print("-" * len(header) * 2)
+    if show_table:
+        columns = truth_columns(symbols)
+        ones = (1 << (1 << len(symbols))) - 1
+        kb_bits = evaluate_bits(parse(kb), columns, ones)
+        query_bits = evaluate_bits(parse(query), columns, ones)
 
-    for values in models:
-        model = dict(zip(symbols, values))
-        kb_val = evaluate(kb, model)
-        query_val = evaluate(query, model)
-        implication = (not kb_val) or query_val
+        print("Truth Table Evaluation:\n")
+        header = " | ".join(symbols) + " | KB | Query | KB ⇒ Query"
+        print(header)
+        print("-" * len(header) * 2)
 
-        if kb_val and not query_val:
-            entails = False
-
-        row = " | ".join(['T' if v else 'F' for v in values])
-        row += f" | {'T' if kb_val else 'F'}  | {'T' if query_val else 'F'}   | {'T' if implication else 'F'}"
-        print(row)
+        for i, values in enumerate(itertools.product([True, False], repeat=len(symbols))):
+            kb_val = kb_bits >> i & 1
+            query_val = query_bits >> i & 1
+            implication = (not kb_val) or query_val
+            row = " | ".join(['T' if v else 'F' for v in values])
+            row += f" | {'T' if kb_val else 'F'}  | {'T' if query_val else 'F'}   | {'T' if implication else 'F'}"
+            print(row)
 
     print("\nResult:")
-    if entails:
+    if result:
         print("The Knowledge Base entails the Query (KB ⊨ Query)")
     else:
         print("The Knowledge Base does NOT entail the Query (KB ⊭ Query)")
+    return result
 
 
 # Example usage:
+if __name__ == "__main__":
+    kb = "(Q -> P) ^ (P -> ~Q) ^ (Q v R)"
+    symbols = ["P", "Q", "R"]
 
-kb = "(Q -> P) ^ (P -> ~Q) ^ (Q v R)"
-symbols = ["P", "Q", "R"]
-
-queries = ["R", "R -> P", "Q -> R"]
+    queries = ["R", "R -> P", "Q -> R"]
 
-for query in queries:
-    print(f"\nEvaluating Query: {query}\n")
-    tt_entails(kb, query, symbols)
-    print("\n" + "="*50 + "\n")
-    
\ No newline at end of file
+    for query in queries:
+        print(f"\nEvaluating Query: {query}\n")
+        tt_entails(kb, query, symbols)
+        print("\n" + "="*50 + "\n")
@@ -1,48 +1,489 @@
+import mmap
 import random
-WINNING_COMBINATIONS = [
-    [0, 1, 2], [3, 4, 5], [6, 7, 8],[0, 3, 6], [1, 4, 7], [2, 5, 8],[0, 4, 8], [2, 4, 6]
-]
+import struct
+import sys
+import time
 
-def print_board(board):
+EMPTY = " "
+WIN_SCORE = 1000
+# Seconds per move the engine thinks on boards larger than 3x3 by default
+DEFAULT_TIME_BUDGET = 0.05
+
+
+def winning_combinations(rows=3, cols=3, k=3):
+    """All k-in-a-row lines (as cell indices) on a rows x cols board"""
+    combos = []
+    directions = [(0, 1), (1, 0), (1, 1), (1, -1)]
+    for r in range(rows):
+        for c in range(cols):
+            for dr, dc in directions:
+                end_r, end_c = r + dr * (k - 1), c + dc * (k - 1)
+                if 0 <= end_r < rows and 0 <= end_c < cols:
+                    combos.append([(r + dr * i) * cols + (c + dc * i) for i in range(k)])
+    return combos
+
+
+WINNING_COMBINATIONS = winning_combinations(3, 3, 3)
+
+
+def board_symmetries(rows=3, cols=3):
+    """Cell permutations for every symmetry of the board (8 if square, else 4)"""
+    transforms = [
+        lambda r, c: (r, c),
+        lambda r, c: (r, cols - 1 - c),
+        lambda r, c: (rows - 1 - r, c),
+        lambda r, c: (rows - 1 - r, cols - 1 - c),
+    ]
+    if rows == cols:
+        transforms += [
+            lambda r, c: (c, r),
+            lambda r, c: (c, rows - 1 - r),
+            lambda r, c: (rows - 1 - c, r),
+            lambda r, c: (rows - 1 - c, rows - 1 - r),
+        ]
+    perms = []
+    for t in transforms:
+        perm = []
+        for r in range(rows):
+            for c in range(cols):
+                sr, sc = t(r, c)
+                perm.append(sr * cols + sc)
+        perms.append(perm)
+    return perms
+
+
+def print_board(board, cols=3):
+    rows = len(board) // cols
     print()
-    for i in range(3):
-        row=board[i*3:(i+1)*3]
+    for i in range(rows):
+        row=board[i*cols:(i+1)*cols]
         print(" | ".join(row))
-        if i < 2:
-            print("-" * 9)
+        if i < rows - 1:
+            print("-" * (4 * cols - 3))
     print()
 
-def check_winner(board, player):
-    for combo in WINNING_COMBINATIONS:
+def check_winner(board, player, combos=WINNING_COMBINATIONS):
+    for combo in combos:
         if all(board[i] == player for i in combo):
             return True
     return False
 
 def is_full(board):
-    return all(cell != " " for cell in board)
+    return all(cell != EMPTY for cell in board)
+
+
+# ----------------------------------------------------------
+# Negamax engine with alpha-beta and a transposition table
+# ----------------------------------------------------------
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class TicTacToeEngine:
+    """
+    Perfect-play engine for m x n boards with k-in-a-row.
+    The transposition table is keyed on the board canonicalized under
+    the board symmetries and survives between moves, so later turns of
+    the same game are answered mostly from the table.
+    Pass max_depth to cap the search on large boards (a heuristic score
+    is used at the cut-off).
+    3x3 boards are searched to the end. Larger ones use iterative
+    deepening under time_budget seconds per move (DEFAULT_TIME_BUDGET
+    unless given; float("inf") searches to the end) and play the best
+    move of the deepest finished iteration, so 4x4 and 5x5 moves come
+    back in milliseconds.
+    """
+
+    def __init__(self, rows=3, cols=3, k=3, max_depth=None, time_budget=None):
+        self.rows, self.cols, self.k = rows, cols, k
+        self.size = rows * cols
+        self.max_depth = max_depth
+        if time_budget is None and self.size > 9:
+            time_budget = DEFAULT_TIME_BUDGET
+        self.time_budget = time_budget
+        self.deadline = None
+        self.combos = winning_combinations(rows, cols, k)
+        self.lines_through = [[] for _ in range(self.size)]
+        for combo in self.combos:
+            for cell in combo:
+                self.lines_through[cell].append(combo)
+        self.symmetries = board_symmetries(rows, cols)
+        center_r, center_c = (rows - 1) / 2, (cols - 1) / 2
+        self.move_order = sorted(
+            range(self.size),
+            key=lambda i: abs(i // cols - center_r) + abs(i % cols - center_c))
+        self.table = {}
+        self.nodes = 0
+
+    def canonical(self, board):
+        """Return (key, perm) where key is the smallest symmetric image of board"""
+        best_key, best_perm = None, None
+        for perm in self.symmetries:
+            key = "".join([board[p] for p in perm])
+            if best_key is None or key < best_key:
+                best_key, best_perm = key, perm
+        return best_key, best_perm
+
+    def wins_with(self, board, move, player):
+        for combo in self.lines_through[move]:
+            if all(board[i] == player for i in combo):
+                return True
+        return False
+
+    def evaluate(self, board, player, opponent):
+        """Heuristic for depth-limited search: open lines weighted by fill"""
+        score = 0
+        for combo in self.combos:
+            mine = theirs = 0
+            for i in combo:
+                if board[i] == player:
+                    mine += 1
+                elif board[i] == opponent:
+                    theirs += 1
+            if theirs == 0 and mine:
+                score += 1 << mine
+            elif mine == 0 and theirs:
+                score -= 1 << theirs
+        return max(-WIN_SCORE // 2, min(WIN_SCORE // 2, score))
+
+    def negamax(self, board, player, opponent, empties, depth, alpha, beta):
+        self.nodes += 1
+        if (self.deadline is not None and not self.nodes & 255
+                and time.perf_counter() > self.deadline):
+            raise SearchTimeout()
+        if empties == 0:
+            return 0, None
+        if depth == 0:
+            return self.evaluate(board, player, opponent), None
+
+        alpha_orig = alpha
+        key, perm = self.canonical(board)
+        key += player
+        entry = self.table.get(key)
+        tt_move = None
+        if entry is not None:
+            value, flag, entry_depth, canon_move = entry
+            tt_move = perm[canon_move]
+            if entry_depth >= depth:
+                if flag == EXACT:
+                    return value, tt_move
+                if flag == LOWER:
+                    alpha = max(alpha, value)
+                elif flag == UPPER:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value, tt_move
+
+        moves = [m for m in self.move_order if board[m] == EMPTY]
+        if tt_move is not None and board[tt_move] == EMPTY:
+            moves.remove(tt_move)
+            moves.insert(0, tt_move)
+
+        best_value, best_move = -WIN_SCORE * 2, moves[0]
+        for move in moves:
+            board[move] = player
+            if self.wins_with(board, move, player):
+                value = WIN_SCORE + empties - 1
+            else:
+                value = -self.negamax(board, opponent, player, empties - 1,
+                                      depth - 1, -beta, -alpha)[0]
+            board[move] = EMPTY
+            if value > best_value:
+                best_value, best_move = value, move
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+
+        if best_value <= alpha_orig:
+            flag = UPPER
+        elif best_value >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.table[key] = (best_value, flag, depth, perm.index(best_move))
+        return best_value, best_move
+
+    def best_move(self, board, player, opponent):
+        board = list(board)
+        empties = board.count(EMPTY)
+        limit = empties if self.max_depth is None else min(self.max_depth, empties)
+        if self.time_budget is None:
+            return self.negamax(board, player, opponent, empties, limit,
+                                -WIN_SCORE * 2, WIN_SCORE * 2)[1]
+
+        # Iterative deepening; the first iteration always finishes so there
+        # is a move, and an unfinished one only leaves complete table entries
+        deadline = time.perf_counter() + self.time_budget
+        move = None
+        for depth in range(1, limit + 1):
+            self.deadline = deadline if move is not None else None
+            try:
+                value, move = self.negamax(board, player, opponent, empties, depth,
+                                           -WIN_SCORE * 2, WIN_SCORE * 2)
+            except SearchTimeout:
+                break
+            finally:
+                self.deadline = None
+            if abs(value) >= WIN_SCORE or time.perf_counter() > deadline:
+                break
+        return move
+
+
+# ----------------------------------------------------------
+# Bitboard mode and headless self-play
+# ----------------------------------------------------------
+class BitBoardGame:
+    """
+    Bitboard rules for an m x n board: each player is an int mask with
+    bit i set for cell i, and wins are tested against precomputed masks
+    of the lines through the last move.
+    """
+
+    def __init__(self, rows=3, cols=3, k=3):
+        self.rows, self.cols, self.k = rows, cols, k
+        self.size = rows * cols
+        self.full = (1 << self.size) - 1
+        self.win_masks = [sum(1 << i for i in combo)
+                          for combo in winning_combinations(rows, cols, k)]
+        self.masks_through = [[m for m in self.win_masks if m >> cell & 1]
+                              for cell in range(self.size)]
+        self._cells = {}
+
+    def is_win(self, mask):
+        return any(mask & m == m for m in self.win_masks)
+
+    def wins_with(self, mask, cell):
+        for m in self.masks_through[cell]:
+            if mask & m == m:
+                return True
+        return False
+
+    def empty_cells(self, mine, theirs):
+        empty = self.full & ~(mine | theirs)
+        cells = self._cells.get(empty)
+        if cells is None:
+            cells = tuple(i for i in range(self.size) if empty >> i & 1)
+            self._cells[empty] = cells
+        return cells
+
+    def to_board(self, x_mask, o_mask):
+        return ["X" if x_mask >> i & 1 else "O" if o_mask >> i & 1 else EMPTY
+                for i in range(self.size)]
 
-def tic_tac_toe():
-    board = [" "] * 9 
+    def play(self, policy_x, policy_o, rng):
+        """Play one game; returns 1 if X wins, -1 if O wins, 0 for a draw"""
+        mine, theirs = 0, 0
+        policies = (policy_x, policy_o)
+        turn = 0
+        while True:
+            cell = policies[turn](self, mine, theirs, rng)
+            mine |= 1 << cell
+            if self.wins_with(mine, cell):
+                return 1 if turn == 0 else -1
+            if mine | theirs == self.full:
+                return 0
+            mine, theirs = theirs, mine
+            turn ^= 1
+
+
+def random_policy(game, mine, theirs, rng):
+    return rng.choice(game.empty_cells(mine, theirs))
+
+
+class MinimaxPolicy:
+    """Exact negamax over bitboards, memoized on (mine, theirs)"""
+
+    def __init__(self):
+        self.memo = {}
+
+    def solve(self, game, mine, theirs):
+        """Return (value, best cell) for the player owning `mine`"""
+        key = (mine, theirs)
+        hit = self.memo.get(key)
+        if hit is not None:
+            return hit
+        best_value, best_cell = -WIN_SCORE * 2, None
+        for cell in game.empty_cells(mine, theirs):
+            after = mine | 1 << cell
+            if game.wins_with(after, cell):
+                value = WIN_SCORE + bin(game.full & ~(after | theirs)).count("1")
+            elif after | theirs == game.full:
+                value = 0
+            else:
+                value = -self.solve(game, theirs, after)[0]
+            if value > best_value:
+                best_value, best_cell = value, cell
+        self.memo[key] = (best_value, best_cell)
+        return best_value, best_cell
+
+    def __call__(self, game, mine, theirs, rng):
+        return self.solve(game, mine, theirs)[1]
+
+
+def build_lookup_table(game):
+    """Solve every reachable position once and keep only the best moves"""
+    solver = MinimaxPolicy()
+    solver.solve(game, 0, 0)
+    return {key: cell for key, (value, cell) in solver.memo.items()}
+
+
+class LookupPolicy:
+    """Plays precomputed best moves, falling back to random off-table"""
+
+    def __init__(self, table):
+        self.table = table
+
+    def __call__(self, game, mine, theirs, rng):
+        cell = self.table.get((mine, theirs))
+        if cell is None:
+            return random_policy(game, mine, theirs, rng)
+        return cell
+
+
+def self_play(policy_x, policy_o, n_games=10000, rows=3, cols=3, k=3, seed=None):
+    """Run n_games headless games and report win/draw rates and games/sec"""
+    game = BitBoardGame(rows, cols, k)
+    rng = random.Random(seed)
+    play = game.play
+    results = {1: 0, -1: 0, 0: 0}
+    start = time.perf_counter()
+    for _ in range(n_games):
+        results[play(policy_x, policy_o, rng)] += 1
+    elapsed = time.perf_counter() - start
+    return {
+        "games": n_games,
+        "x_win_rate": results[1] / n_games,
+        "o_win_rate": results[-1] / n_games,
+        "draw_rate": results[0] / n_games,
+        "games_per_sec": n_games / elapsed if elapsed > 0 else float("inf"),
+    }
+
+
+# ----------------------------------------------------------
+# Precomputed game-state table (memory-mapped)
+# ----------------------------------------------------------
+TABLE_MAGIC = b"TTT\x01"
+TABLE_HEADER = struct.Struct("<4sBBBxI")
+NO_MOVE = 0xFF
+
+
+def base3_weights(size):
+    """weights[mask] = sum of 3**i over set bits, so index = w[x] + 2*w[o]"""
+    weights = [0] * (1 << size)
+    for mask in range(1, 1 << size):
+        low = (mask & -mask).bit_length() - 1
+        weights[mask] = weights[mask & (mask - 1)] + 3 ** low
+    return weights
+
+
+def build_state_table(path, rows=3, cols=3, k=3):
+    """
+    Enumerate every legal position reachable under the game rules and
+    write its value (for the side to move) and best move to `path`.
+    Entries are 2 bytes at the base-3 index of the board, a perfect hash
+    with 3**(rows*cols) slots; unreachable slots are left as 0xFF.
+    Returns the number of legal positions (5478 for 3x3).
+    """
+    game = BitBoardGame(rows, cols, k)
+    solver = MinimaxPolicy()
+    weights = base3_weights(game.size)
+    table = bytearray(b"\xff" * (2 * 3 ** game.size))
+    count = 0
+    stack = [(0, 0)]
+    while stack:
+        x, o = stack.pop()
+        slot = 2 * (weights[x] + 2 * weights[o])
+        if table[slot] != 0xFF:
+            continue
+        count += 1
+        x_to_move = bin(x).count("1") == bin(o).count("1")
+        mover, other = (x, o) if x_to_move else (o, x)
+        if game.is_win(other):
+            value, move = -1, NO_MOVE
+        elif x | o == game.full:
+            value, move = 0, NO_MOVE
+        else:
+            score, move = solver.solve(game, mover, other)
+            value = (score > 0) - (score < 0)
+            for cell in game.empty_cells(x, o):
+                if x_to_move:
+                    stack.append((x | 1 << cell, o))
+                else:
+                    stack.append((x, o | 1 << cell))
+        table[slot] = value + 1
+        table[slot + 1] = move
+    with open(path, "wb") as f:
+        f.write(TABLE_HEADER.pack(TABLE_MAGIC, rows, cols, k, count))
+        f.write(table)
+    return count
+
+
+class StateTable:
+    """
+    Read-only, memory-mapped view of a table written by build_state_table.
+    The OS shares the mapped pages between processes, so every game session
+    gets O(1) lookups without loading or searching anything.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.rows, self.cols, self.k, self.count = \
+            TABLE_HEADER.unpack_from(self.data, 0)
+        if magic != TABLE_MAGIC:
+            raise ValueError(f"{path} is not a tic-tac-toe state table")
+        self.size = self.rows * self.cols
+        self.weights = base3_weights(self.size)
+
+    def lookup(self, x_mask, o_mask):
+        """Return (value for side to move, best move or None)"""
+        slot = TABLE_HEADER.size + 2 * (self.weights[x_mask] + 2 * self.weights[o_mask])
+        value, move = self.data[slot], self.data[slot + 1]
+        if value == 0xFF:
+            raise KeyError("position is not reachable")
+        return value - 1, (None if move == NO_MOVE else move)
+
+    def best_move(self, board):
+        x_mask = sum(1 << i for i, cell in enumerate(board) if cell == "X")
+        o_mask = sum(1 << i for i, cell in enumerate(board) if cell == "O")
+        return self.lookup(x_mask, o_mask)[1]
+
+    def __call__(self, game, mine, theirs, rng):
+        if bin(mine).count("1") == bin(theirs).count("1"):
+            return self.lookup(mine, theirs)[1]
+        return self.lookup(theirs, mine)[1]
+
+    def close(self):
+        self.data.close()
+
+
+def tic_tac_toe(rows=3, cols=3, k=3, max_depth=None, time_budget=None):
+    board = [EMPTY] * (rows * cols)
+    combos = winning_combinations(rows, cols, k)
+    engine = TicTacToeEngine(rows, cols, k, max_depth, time_budget)
     human = "X"
     computer = "O"
     print("Welcome to Tic Tac Toe!")
     print("You are X, Computer is O.")
-    print_board(board)
+    print_board(board, cols)
     while True:
         while True:
             try:
-                move = int(input("Enter your move (1-9): ")) - 1
-                if move < 0 or move > 8:
+                move = int(input(f"Enter your move (1-{len(board)}): ")) - 1
+                if move < 0 or move >= len(board):
                     raise ValueError
-                if board[move] == " ":
+                if board[move] == EMPTY:
                     board[move]=human
                     break
                 else:
                     print("Cell already taken. Try again.")
             except ValueError:
-                print("Invalid input. Enter a number between 1-9.")
-        print_board(board)
-        if check_winner(board, human):
+                print(f"Invalid input. Enter a number between 1-{len(board)}.")
+        print_board(board, cols)
+        if check_winner(board, human, combos):
             print("You win!")
             break
         if is_full(board):
@@ -50,13 +491,10 @@ def tic_tac_toe():
             break
 
         print("Computer's turn...")
-        while True:
-            move = random.randint(0, 8)
-            if board[move] == " ":
-                board[move] = computer
-                break
-        print_board(board)
-        if check_winner(board, computer):
+        move = engine.best_move(board, computer, human)
+        board[move] = computer
+        print_board(board, cols)
+        if check_winner(board, computer, combos):
             print("Computer wins!")
             break
         if is_full(board):
@@ -65,5 +503,8 @@ def tic_tac_toe():
 
 
 if __name__ == "__main__":
-    tic_tac_toe()
-
+    if len(sys.argv) == 3 and sys.argv[1] == "--build-table":
+        count = build_state_table(sys.argv[2])
+        print(f"Wrote {count} positions to {sys.argv[2]}")
+    else:
+        tic_tac_toe()
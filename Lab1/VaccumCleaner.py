@@ -1,3 +1,5 @@
+import heapq
+
 DIRTY = "Dirty"
 CLEAN = "Clean"
 
@@ -25,19 +27,200 @@ def vacuum_agent(state):
             state[2] = "A"
     return state
 
-print("Vacuum Cleaner Problem Simulation")
-roomA = input("Enter state of Room A (Clean/Dirty):").capitalize()
-roomB = input("Enter state of Room B (Clean/Dirty):").capitalize()
-agent_pos = input("Enter initial Agent Position (A/B)").upper()
-if roomA not in [CLEAN, DIRTY] or roomB not in [CLEAN, DIRTY] or agent_pos not in ["A", "B"]:
-    print("Invalid input! Please restart and enter values correctly.")
-    exit()
-state = [roomA, roomB, agent_pos]
-print("\nInitial State:")
-print_state(state)
-print()
-print("Vacuum Cleaner Starting!")
-while not is_goal(state):
-    state=vacuum_agent(state)
+# ----------------------------------------------------------
+# Route planning for large grids
+# ----------------------------------------------------------
+_plan_cache = {}
+_mst_cache = {}
+
+
+def manhattan(a, b):
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+def mst_weight(mask, cells):
+    """Weight of a minimum spanning tree (Prim) over the dirty cells in mask"""
+    if mask in _mst_cache:
+        return _mst_cache[mask]
+    nodes = [cells[i] for i in range(len(cells)) if mask >> i & 1]
+    total = 0
+    if nodes:
+        dist = [manhattan(nodes[0], n) for n in nodes]
+        in_tree = [False] * len(nodes)
+        in_tree[0] = True
+        for _ in range(len(nodes) - 1):
+            j = min((d, i) for i, d in enumerate(dist) if not in_tree[i])[1]
+            in_tree[j] = True
+            total += dist[j]
+            for i, n in enumerate(nodes):
+                if not in_tree[i]:
+                    dist[i] = min(dist[i], manhattan(nodes[j], n))
+    _mst_cache[mask] = total
+    return total
+
+
+def moves_between(a, b):
+    (r, c), (tr, tc) = a, b
+    steps = ["Down" if tr > r else "Up"] * abs(tr - r)
+    steps += ["Right" if tc > c else "Left"] * abs(tc - c)
+    return steps
+
+
+def mst_preorder(start, cells):
+    """
+    Visiting order of the dirty cells from a preorder walk of a minimum
+    spanning tree (Prim, O(k^2)) over start and the cells. The optimal
+    route is itself a spanning tree, and the walk shortcuts a traversal of
+    the MST that uses each edge twice, so it is at most 2x optimal.
+    """
+    nodes = [start] + cells
+    dist = [manhattan(start, n) for n in nodes]
+    link = [0] * len(nodes)
+    in_tree = [False] * len(nodes)
+    in_tree[0] = True
+    children = [[] for _ in nodes]
+    for _ in range(len(cells)):
+        j = min((d, i) for i, d in enumerate(dist) if not in_tree[i])[1]
+        in_tree[j] = True
+        children[link[j]].append(j)
+        for i, n in enumerate(nodes):
+            if not in_tree[i]:
+                d = manhattan(nodes[j], n)
+                if d < dist[i]:
+                    dist[i], link[i] = d, j
+    order, stack = [], [0]
+    while stack:
+        j = stack.pop()
+        if j:
+            order.append(j - 1)
+        stack.extend(reversed(children[j]))
+    return order
+
+
+def two_opt(start, cells, order):
+    """
+    Reverse segments of the route while that shortens it. The route is
+    open (it ends at the last cell), so a segment running to the end only
+    changes the edge entering it. Never lengthens the route.
+    """
+    points = [start] + [cells[i] for i in order]
+    improved = True
+    while improved:
+        improved = False
+        for i in range(1, len(points) - 1):
+            for j in range(i + 1, len(points)):
+                a, b = points[i - 1], points[i]
+                before = manhattan(a, b)
+                after = manhattan(a, points[j])
+                if j + 1 < len(points):
+                    before += manhattan(points[j], points[j + 1])
+                    after += manhattan(b, points[j + 1])
+                if after < before:
+                    points[i:j + 1] = reversed(points[i:j + 1])
+                    order[i - 1:j] = reversed(order[i - 1:j])
+                    improved = True
+    return order
+
+
+def astar_order(cells, start, w):
+    """
+    Visiting order from A* over (position, remaining-dirt bitmask) states
+    where each step walks to one dirty cell and sucks it. The heuristic is
+    the number of dirty cells plus the nearest dirty cell plus the MST over
+    the remaining ones, which never overestimates; with w > 1 the order is
+    at most w times the optimal length.
+    """
+    full = (1 << len(cells)) - 1
+    _mst_cache.clear()
+
+    def h(pos, mask):
+        if mask == 0:
+            return 0
+        nearest = min(manhattan(pos, cells[i]) for i in range(len(cells)) if mask >> i & 1)
+        return bin(mask).count("1") + nearest + mst_weight(mask, cells)
+
+    # Positions are either the start (-1) or the index of the last cleaned cell
+    start_state = (-1, full)
+    g_score = {start_state: 0}
+    parent = {start_state: None}
+    counter = 0
+    open_list = [(w * h(start, full), 0, counter, start_state)]
+    goal = None
+    while open_list:
+        f, g, _, state = heapq.heappop(open_list)
+        if g > g_score[state]:
+            continue
+        at, mask = state
+        if mask == 0:
+            goal = state
+            break
+        pos = start if at == -1 else cells[at]
+        for i in range(len(cells)):
+            if mask >> i & 1:
+                nxt = (i, mask & ~(1 << i))
+                g_new = g + manhattan(pos, cells[i]) + 1
+                if g_new < g_score.get(nxt, float("inf")):
+                    g_score[nxt] = g_new
+                    parent[nxt] = state
+                    counter += 1
+                    heapq.heappush(open_list, (g_new + w * h(cells[i], nxt[1]), g_new, counter, nxt))
+
+    order = []
+    while goal is not None and goal[0] != -1:
+        order.append(goal[0])
+        goal = parent[goal]
+    return order[::-1]
+
+
+def plan_cleaning(dirty_cells, start, exact_limit=12, weight=2.0, weighted_limit=30):
+    """
+    Plan a short action sequence that cleans every cell in dirty_cells
+    (list of (row, col)) starting from start (row, col).
+    Up to exact_limit dirty cells the visiting order comes from A* and is
+    optimal; up to weighted_limit from weighted A*, at most `weight` times
+    the optimal length. Beyond that the exponential state space is out of
+    reach, so the order is an MST preorder walk improved by 2-opt, which
+    is polynomial and at most 2x optimal.
+    Plans are cached by (dirt mask, start).
+    """
+    cells = sorted(set(dirty_cells))
+    if len(cells) <= exact_limit:
+        method = 1.0
+    elif len(cells) <= weighted_limit:
+        method = weight
+    else:
+        method = "mst"
+    key = (tuple(cells), start, method)
+    if key in _plan_cache:
+        return _plan_cache[key]
+
+    if method == "mst":
+        order = two_opt(start, cells, mst_preorder(start, cells))
+    else:
+        order = astar_order(cells, start, method)
+    plan = []
+    pos = start
+    for i in order:
+        plan += moves_between(pos, cells[i]) + ["Suck"]
+        pos = cells[i]
+    _plan_cache[key] = plan
+    return plan
+
+
+if __name__ == "__main__":
+    print("Vacuum Cleaner Problem Simulation")
+    roomA = input("Enter state of Room A (Clean/Dirty):").capitalize()
+    roomB = input("Enter state of Room B (Clean/Dirty):").capitalize()
+    agent_pos = input("Enter initial Agent Position (A/B)").upper()
+    if roomA not in [CLEAN, DIRTY] or roomB not in [CLEAN, DIRTY] or agent_pos not in ["A", "B"]:
+        print("Invalid input! Please restart and enter values correctly.")
+        exit()
+    state = [roomA, roomB, agent_pos]
+    print("\nInitial State:")
     print_state(state)
-print("Task Completed! Both Room Are Clean")
\ No newline at end of file
+    print()
+    print("Vacuum Cleaner Starting!")
+    while not is_goal(state):
+        state=vacuum_agent(state)
+        print_state(state)
+    print("Task Completed! Both Room Are Clean")
@@ -0,0 +1,140 @@
+import numpy as np
+
+# Actions shared by every agent program
+SUCK, UP, DOWN, LEFT, RIGHT, NOOP = range(6)
+ACTION_NAMES = ["Suck", "Up", "Down", "Left", "Right", "NoOp"]
+ROW_DELTA = np.array([0, -1, 1, 0, 0, 0])
+COL_DELTA = np.array([0, 0, 0, -1, 1, 0])
+
+
+class VacuumWorld:
+    """
+    Headless vacuum world on a rows x cols grid of rooms, simulating
+    n_agents independent episodes at once. Dirt maps are a bool array of
+    shape (n_agents, rows, cols) and positions an int array (n_agents, 2).
+    Each step, every clean room turns dirty again with probability
+    dirt_prob. Performance is +1 per clean room per step, minus move_cost
+    for every move action.
+    """
+
+    def __init__(self, rows=1, cols=2, n_agents=1, dirt_prob=0.0,
+                 initial_dirt=0.5, move_cost=0.0, seed=None):
+        self.rows, self.cols = rows, cols
+        self.n_agents = n_agents
+        self.dirt_prob = dirt_prob
+        self.initial_dirt = initial_dirt
+        self.move_cost = move_cost
+        self.rng = np.random.default_rng(seed)
+        self.agent_index = np.arange(n_agents)
+        self.reset()
+
+    def reset(self):
+        shape = (self.n_agents, self.rows, self.cols)
+        self.dirt = self.rng.random(shape) < self.initial_dirt
+        self.rows_pos = self.rng.integers(0, self.rows, self.n_agents)
+        self.cols_pos = self.rng.integers(0, self.cols, self.n_agents)
+        self.scores = np.zeros(self.n_agents)
+        self.steps = 0
+        return self.percept()
+
+    @property
+    def positions(self):
+        return np.stack([self.rows_pos, self.cols_pos], axis=1)
+
+    def percept(self):
+        """(positions, dirty-here flags) for every agent"""
+        dirty_here = self.dirt[self.agent_index, self.rows_pos, self.cols_pos]
+        return self.positions, dirty_here
+
+    def step(self, actions):
+        actions = np.asarray(actions)
+        suck = actions == SUCK
+        self.dirt[self.agent_index[suck], self.rows_pos[suck], self.cols_pos[suck]] = False
+
+        # Bumping into a wall leaves the agent where it is
+        self.rows_pos = np.clip(self.rows_pos + ROW_DELTA[actions], 0, self.rows - 1)
+        self.cols_pos = np.clip(self.cols_pos + COL_DELTA[actions], 0, self.cols - 1)
+
+        if self.dirt_prob > 0:
+            self.dirt |= self.rng.random(self.dirt.shape) < self.dirt_prob
+
+        clean = self.rows * self.cols - self.dirt.sum(axis=(1, 2))
+        moved = (actions != SUCK) & (actions != NOOP)
+        self.scores += clean - self.move_cost * moved
+        self.steps += 1
+        return self.percept()
+
+    def all_clean(self):
+        return ~self.dirt.any(axis=(1, 2))
+
+    def run(self, agent, steps):
+        """Run one episode of `steps` steps per agent; returns the score array"""
+        self.reset()
+        if hasattr(agent, "reset"):
+            agent.reset(self)
+        positions, dirty_here = self.percept()
+        for _ in range(steps):
+            positions, dirty_here = self.step(agent(positions, dirty_here, self.rng))
+        return self.scores.copy()
+
+
+def evaluate(agent, n_episodes, steps, batch_size=10000, seed=None, **world_args):
+    """Score an agent program over n_episodes episodes, batch_size at a time"""
+    seeds = np.random.SeedSequence(seed)
+    scores = []
+    remaining = n_episodes
+    while remaining > 0:
+        world = VacuumWorld(n_agents=min(batch_size, remaining),
+                            seed=seeds.spawn(1)[0], **world_args)
+        scores.append(world.run(agent, steps))
+        remaining -= world.n_agents
+    scores = np.concatenate(scores)
+    return {"episodes": n_episodes, "mean": scores.mean(), "std": scores.std(),
+            "scores": scores}
+
+
+# ----------------------------------------------------------
+# Vectorized agent programs
+# ----------------------------------------------------------
+class RandomReflexAgent:
+    """Suck if dirty, otherwise move in a random direction"""
+
+    def __call__(self, positions, dirty_here, rng):
+        moves = rng.integers(UP, RIGHT + 1, len(dirty_here))
+        return np.where(dirty_here, SUCK, moves)
+
+
+class SweepAgent:
+    """
+    Suck if dirty, otherwise sweep rows back and forth, stepping to the
+    next row at each wall. On the two-room world this is the classic
+    A <-> B reflex agent.
+    """
+
+    def reset(self, world):
+        self.rows, self.cols = world.rows, world.cols
+        self.h_dir = np.ones(world.n_agents, dtype=int)
+        self.v_dir = np.ones(world.n_agents, dtype=int)
+
+    def __call__(self, positions, dirty_here, rng):
+        r, c = positions[:, 0], positions[:, 1]
+        moving = ~dirty_here
+        blocked_h = moving & ((c + self.h_dir < 0) | (c + self.h_dir >= self.cols))
+        self.h_dir = np.where(blocked_h, -self.h_dir, self.h_dir)
+
+        blocked_v = (r + self.v_dir < 0) | (r + self.v_dir >= self.rows)
+        flip_v = blocked_h & blocked_v
+        self.v_dir = np.where(flip_v, -self.v_dir, self.v_dir)
+
+        horizontal = np.where(self.h_dir > 0, RIGHT, LEFT)
+        vertical = np.where(self.v_dir > 0, DOWN, UP)
+        moves = np.where(blocked_h & (self.rows > 1), vertical, horizontal)
+        return np.where(dirty_here, SUCK, moves)
+
+
+if __name__ == "__main__":
+    for agent in (RandomReflexAgent(), SweepAgent()):
+        result = evaluate(agent, n_episodes=10000, steps=200,
+                          rows=5, cols=5, dirt_prob=0.01, seed=0)
+        print(f"{type(agent).__name__}: mean score {result['mean']:.1f} "
+              f"(std {result['std']:.1f}) over {result['episodes']} episodes")